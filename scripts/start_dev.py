@@ -93,12 +93,12 @@ def main() -> int:
             except Exception:
                 return False
 
-        # If current interpreter already has apscheduler, use it
-        if test_import(sys.executable, "apscheduler"):
+        # If current interpreter already has the backend requirements, use it
+        if test_import(sys.executable, "orjson"):
             return sys.executable
 
         # If venv exists and works, use it
-        if os.path.exists(venv_python) and test_import(venv_python, "apscheduler"):
+        if os.path.exists(venv_python) and test_import(venv_python, "orjson"):
             return venv_python
 
         # Create venv and install requirements
@@ -113,7 +113,7 @@ def main() -> int:
             print("Failed to create venv or install backend requirements:", e)
             return sys.executable
 
-        if test_import(venv_python, "apscheduler"):
+        if test_import(venv_python, "orjson"):
             return venv_python
         return sys.executable
 
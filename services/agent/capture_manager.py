@@ -1,4 +1,6 @@
-﻿import subprocess
+﻿import csv
+import json
+import subprocess
 import threading
 import uuid
 from datetime import datetime
@@ -22,12 +24,8 @@ def write_capture_metadata(
         test_metadata_file: Optional path to a test-specific metadata CSV file.
             If provided, metadata is also written to this file.
     """
-    from pathlib import Path as _Path
-    import json as _json
-    import csv as _csv
-
-    if not isinstance(output_directory, _Path):
-        output_directory = _Path(output_directory)
+    if not isinstance(output_directory, Path):
+        output_directory = Path(output_directory)
 
     metadata_file_csv = output_directory / "captures_meta.csv"
     metadata_file_json = output_directory / "captures_meta.jsonl"
@@ -36,23 +34,23 @@ def write_capture_metadata(
         # Write to central metadata files
         is_new_csv = not metadata_file_csv.exists()
         with metadata_file_csv.open("a", encoding="utf-8", newline="") as f_csv:
-            writer = _csv.DictWriter(f_csv, fieldnames=sorted(row.keys()))
+            writer = csv.DictWriter(f_csv, fieldnames=sorted(row.keys()))
             if is_new_csv:
                 writer.writeheader()
             writer.writerow(row)
 
         with metadata_file_json.open("a", encoding="utf-8") as f_json:
-            f_json.write(_json.dumps(row, ensure_ascii=False) + "\n")
+            f_json.write(json.dumps(row, ensure_ascii=False) + "\n")
 
         # Write to test-specific metadata file if enabled
         if test_metadata_file is not None:
-            if not isinstance(test_metadata_file, _Path):
-                test_metadata_file = _Path(test_metadata_file)
+            if not isinstance(test_metadata_file, Path):
+                test_metadata_file = Path(test_metadata_file)
             # Ensure parent directory exists
             test_metadata_file.parent.mkdir(parents=True, exist_ok=True)
             is_new_test_csv = not test_metadata_file.exists()
             with test_metadata_file.open("a", encoding="utf-8", newline="") as f_test:
-                writer = _csv.DictWriter(f_test, fieldnames=sorted(row.keys()))
+                writer = csv.DictWriter(f_test, fieldnames=sorted(row.keys()))
                 if is_new_test_csv:
                     writer.writeheader()
                 writer.writerow(row)
@@ -7,7 +7,7 @@ import json
 import logging
 from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from services.agent.tab_models import LogEntry, Tab, TabStatus, utcnow_iso
@@ -313,6 +313,35 @@ class TabManager:
                 "lastSeq": tab.log_seq,
             }
 
+    async def iter_logs(
+        self, tab_id: str, *, after: Optional[int] = None
+    ) -> Tuple[int, Iterator[dict[str, Any]]]:
+        """
+        Get logs for a tab as an iterator of entry dicts.
+        
+        Only the entry references are copied under the lock; the dicts are
+        built lazily while the caller consumes the iterator.
+        
+        Args:
+            tab_id: Tab ID
+            after: Only return logs with seq > after (optional)
+            
+        Returns:
+            Tuple of (last sequence number, iterator of log entry dicts)
+            
+        Raises:
+            TabNotFoundError: If tab doesn't exist
+        """
+        async with self._lock:
+            tab = self._tabs.get(tab_id)
+            if not tab:
+                raise TabNotFoundError(f"Tab '{tab_id}' nicht gefunden")
+            logs = list(tab.logs)
+            last_seq = tab.log_seq
+        if after is not None:
+            return last_seq, (log.to_dict() for log in logs if log.seq > after)
+        return last_seq, (log.to_dict() for log in logs)
+
     async def append_log(
         self, 
         tab_id: str, 
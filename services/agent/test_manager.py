@@ -15,7 +15,9 @@ import asyncio
 import contextlib
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
 
 from services.agent.capture_manager import write_capture_metadata
 from services.agent.run_executor import (
@@ -81,43 +83,64 @@ class TestExecutionManager:
             tcpdump_bin=tcpdump_bin,
         )
 
-        # Event broadcasting
+        # Event broadcasting (listeners receive pre-encoded JSON frames)
         self._lock = asyncio.Lock()
-        self._listeners: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._listeners: set[asyncio.Queue[str]] = set()
+
+        # Encoded snapshot shared by all new subscribers, reset on every broadcast
+        self._snapshot_frame: Optional[str] = None
+        self._state_version = 0
 
     # ------------------------------------------------------------------
     # Listener management
     # ------------------------------------------------------------------
 
-    async def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
-        """Subscribe to test execution events."""
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=1000)
+    async def subscribe(self) -> asyncio.Queue[str]:
+        """Subscribe to test execution events (JSON-encoded frames)."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1000)
         async with self._lock:
             self._listeners.add(queue)
         return queue
 
-    async def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+    async def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
         """Unsubscribe from test execution events."""
         async with self._lock:
             self._listeners.discard(queue)
 
+    async def snapshot_frame(self) -> str:
+        """Get the JSON-encoded tab snapshot for new subscribers."""
+        frame = self._snapshot_frame
+        if frame is None:
+            version = self._state_version
+            tabs = await self.tab_manager.list_tabs()
+            frame = orjson.dumps({"type": "snapshot", "tabs": tabs}).decode()
+            # Only keep it if no event arrived while the tabs were listed
+            if version == self._state_version:
+                self._snapshot_frame = frame
+        return frame
+
     async def _broadcast(self, event: dict[str, Any]) -> None:
         """Broadcast event to all listeners."""
+        # Every event reflects a state change, so the cached snapshot is stale now
+        self._state_version += 1
+        self._snapshot_frame = None
+        frame = orjson.dumps(event).decode()
         async with self._lock:
             listeners = list(self._listeners)
         for queue in listeners:
             try:
-                queue.put_nowait(event)
+                queue.put_nowait(frame)
             except asyncio.QueueFull:
                 pass  # Drop events for slow consumers
 
     async def notify_shutdown(self) -> None:
         """Notify all listener queues about server shutdown."""
+        frame = orjson.dumps({"type": "server_shutdown"}).decode()
         async with self._lock:
             listeners = list(self._listeners)
         for queue in listeners:
             with contextlib.suppress(Exception):
-                queue.put_nowait({"type": "server_shutdown"})
+                queue.put_nowait(frame)
 
     # ------------------------------------------------------------------
     # Tab CRUD (delegated to TabManager)
@@ -168,6 +191,12 @@ class TestExecutionManager:
         """Get logs for a tab."""
         return await self.tab_manager.get_logs(tab_id, after=after)
 
+    async def get_logs_iter(
+        self, tab_id: str, *, after: Optional[int] = None
+    ) -> tuple[int, Iterator[dict[str, Any]]]:
+        """Get logs for a tab as (lastSeq, iterator of entries) for streaming."""
+        return await self.tab_manager.iter_logs(tab_id, after=after)
+
     async def _append_log(
         self, 
         tab_id: str, 
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import contextlib
 
+from services.api.profile_service import flush_pending_profiles
+from services.api.routes.system import start_cpu_sampler, stop_cpu_sampler
+from services.api.ssh_service import flush_pending_users
+
 
 def create_startup_handler(schedule_manager, tests_manager):
 	async def on_startup():  # pragma: no cover
@@ -9,6 +13,8 @@ def create_startup_handler(schedule_manager, tests_manager):
 		schedule_manager.start()
 		# Now refresh all jobs in the async context
 		await schedule_manager._refresh_all_jobs()
+		# sample CPU usage in the background for /system/resources
+		start_cpu_sampler()
 
 	return on_startup
 
@@ -23,6 +29,13 @@ def create_shutdown_handler(schedule_manager, tests_manager):
 		# Stop scheduler
 		with contextlib.suppress(Exception):
 			await schedule_manager.stop()
+		with contextlib.suppress(Exception):
+			await stop_cpu_sampler()
+		# Write profile and SSH user updates that are still waiting for their debounced flush
+		with contextlib.suppress(Exception):
+			flush_pending_profiles()
+		with contextlib.suppress(Exception):
+			flush_pending_users()
 
 	return on_shutdown
 
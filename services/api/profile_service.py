@@ -1,18 +1,33 @@
 from __future__ import annotations
 
 from pathlib import Path
-from uuid import uuid4
-from datetime import datetime, timezone
-import json
+import copy
+import logging
+import os
 import re
+import time
+from uuid import uuid4
 
+import orjson
 from fastapi import HTTPException
 
 from services.api.deps import PROFILES_DIR
+from services.api.utils.debounce import DebouncedFlush
+
+logger = logging.getLogger(__name__)
+
+# Debounced profile writes: rapid updates of the same profile within this delay are
+# coalesced into a single file write; pending documents are served by the read paths
+PROFILE_WRITE_DELAY_S = 2.0
+_pending_profiles: dict[str, dict] = {}
+# Parsed profiles as compact JSON, keyed by the (mtime_ns, size) of their file
+_profile_cache: dict[str, tuple[tuple[int, int], bytes]] = {}
 
 
 def utcnow_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    # Direct formatting of gmtime() avoids building a datetime and parsing a strftime pattern
+    g = time.gmtime()
+    return f"{g.tm_year:04d}{g.tm_mon:02d}{g.tm_mday:02d}T{g.tm_hour:02d}{g.tm_min:02d}{g.tm_sec:02d}Z"
 
 
 def ensure_profiles_dir() -> None:
@@ -119,13 +134,14 @@ def profile_path(profile_id: str) -> Path:
     return PROFILES_DIR / f"{safe}.json"
 
 
-def get_builtin_profile_payload(profile_id: str) -> dict | None:
+def get_builtin_profile_payload(profile_id: str, now: str | None = None) -> dict | None:
     """Generate the payload for a builtin profile."""
     if profile_id not in BUILTIN_PROFILES:
         return None
     
     profile_def = BUILTIN_PROFILES[profile_id]
-    now = utcnow_iso()
+    if now is None:
+        now = utcnow_iso()
     return {
         "id": profile_def["id"],
         "name": profile_def["name"],
@@ -137,6 +153,29 @@ def get_builtin_profile_payload(profile_id: str) -> dict | None:
     }
 
 
+def _dump_profile(payload: dict) -> bytes:
+    """Serialize a profile document in the on-disk format (UTF-8, 2-space indent)."""
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+
+
+# Serialized builtin profiles, split around the timestamp fields. The payloads only differ
+# in createdUtc/updatedUtc, so writing one just joins the parts with the current timestamp.
+_TIMESTAMP_SENTINEL = "__TS__"
+_BUILTIN_TEMPLATES: dict[str, list[bytes]] = {
+    pid: _dump_profile(get_builtin_profile_payload(pid, _TIMESTAMP_SENTINEL)).split(
+        f'"{_TIMESTAMP_SENTINEL}"'.encode()
+    )
+    for pid in BUILTIN_PROFILES
+}
+
+
+def write_builtin_profile(profile_id: str, path: Path) -> None:
+    """Write the freshly initialized builtin profile to disk."""
+    content = f'"{utcnow_iso()}"'.encode().join(_BUILTIN_TEMPLATES[profile_id])
+    path.write_bytes(content)
+    invalidate_profile_cache(profile_id)
+
+
 def default_profile_payload() -> dict:
     """Backward compatibility - returns the default profile payload."""
     return get_builtin_profile_payload("default")  # type: ignore
@@ -148,35 +187,106 @@ def ensure_builtin_profiles() -> None:
     for profile_id in BUILTIN_PROFILES:
         p = profile_path(profile_id)
         if not p.exists():
-            payload = get_builtin_profile_payload(profile_id)
-            if payload:
-                try:
-                    with p.open("w", encoding="utf-8") as f:
-                        json.dump(payload, f, ensure_ascii=False, indent=2)
-                except Exception:
-                    pass  # Ignore errors during initialization
+            try:
+                write_builtin_profile(profile_id, p)
+            except Exception:
+                pass  # Ignore errors during initialization
+
+
+def _write_profile_file(path: Path, payload: dict) -> None:
+    """Atomically replace a profile file."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(_dump_profile(payload))
+    os.replace(tmp, path)
+
+
+def queue_profile_write(profile_id: str, payload: dict) -> None:
+    """
+    Store a profile update and write it to disk after PROFILE_WRITE_DELAY_S.
+    Must be called from the running event loop.
+    """
+    _pending_profiles[profile_id] = payload
+    _profile_flush.schedule()
+
+
+def flush_pending_profiles() -> None:
+    """Write all queued profile updates to disk (also called on shutdown)."""
+    _profile_flush.flush()
+
+
+def _write_pending_profiles() -> None:
+    for profile_id, payload in list(_pending_profiles.items()):
+        try:
+            _write_profile_file(profile_path(profile_id), payload)
+        except Exception as exc:  # noqa: BLE001
+            logger.error(f"Profil {profile_id} konnte nicht gespeichert werden: {exc}")
+            continue
+        invalidate_profile_cache(profile_id)
+        # Keep the entry if it was replaced by a newer update in the meantime
+        if _pending_profiles.get(profile_id) is payload:
+            del _pending_profiles[profile_id]
+
+
+_profile_flush = DebouncedFlush(PROFILE_WRITE_DELAY_S, _write_pending_profiles)
+
+
+def invalidate_profile_cache(profile_id: str) -> None:
+    """Drop the cached copy of a profile (called on every write/delete)."""
+    _profile_cache.pop(profile_id, None)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def profile_exists(profile_id: str) -> bool:
+    """Cheap existence check for validation, without reading the profile."""
+    return (
+        profile_id in BUILTIN_PROFILES
+        or profile_id in _pending_profiles
+        or profile_path(profile_id).is_file()
+    )
 
 
 def load_profile(profile_id: str) -> dict:
+    pending = _pending_profiles.get(profile_id)
+    if pending is not None:
+        return copy.deepcopy(pending)
+
+    path = profile_path(profile_id)
+    cached = _profile_cache.get(profile_id)
+    if cached is not None and cached[0] == _file_signature(path):
+        # Parsing the compact cached JSON is cheaper than a deepcopy and
+        # hands every caller its own mutable dict
+        return orjson.loads(cached[1])
+
+    data = _read_profile(profile_id)
+    signature = _file_signature(path)
+    if signature is not None:
+        _profile_cache[profile_id] = (signature, orjson.dumps(data))
+    return data
+
+
+def _read_profile(profile_id: str) -> dict:
     ensure_profiles_dir()
     
     # Ensure builtin profile exists
     if profile_id in BUILTIN_PROFILES:
         p = profile_path(profile_id)
         if not p.exists():
-            payload = get_builtin_profile_payload(profile_id)
-            if payload:
-                try:
-                    with p.open("w", encoding="utf-8") as f:
-                        json.dump(payload, f, ensure_ascii=False, indent=2)
-                except Exception as exc:
-                    raise HTTPException(status_code=500, detail=f"Builtin-Profil konnte nicht angelegt werden: {exc}")
+            try:
+                write_builtin_profile(profile_id, p)
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=f"Builtin-Profil konnte nicht angelegt werden: {exc}")
     path = profile_path(profile_id)
     if not path.exists():
         raise HTTPException(status_code=404, detail="Profil nicht gefunden")
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Profil konnte nicht gelesen werden: {exc}")
 
@@ -224,8 +334,7 @@ def load_profile(profile_id: str) -> dict:
 
         if changed:
             try:
-                with path.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                path.write_bytes(_dump_profile(data))
             except Exception as exc:  # noqa: BLE001
                 raise HTTPException(status_code=500, detail=f"Builtin-Profil konnte nicht aktualisiert werden: {exc}")
 
@@ -244,27 +353,43 @@ def save_profile(payload: dict, *, overwrite: bool = False) -> dict:
     if path.exists() and not overwrite:
         raise HTTPException(status_code=409, detail="Profil-ID existiert bereits")
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        path.write_bytes(_dump_profile(payload))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Profil konnte nicht gespeichert werden: {exc}")
+    finally:
+        invalidate_profile_cache(profile_id)
     return payload
 
 
+# Set once the builtin profiles were created/migrated by list_profiles in this process
+_BUILTINS_ENSURED = False
+
+
 def list_profiles() -> list[dict]:
+    global _BUILTINS_ENSURED
     ensure_profiles_dir()
-    # Ensure all builtin profiles exist
-    for builtin_id in BUILTIN_PROFILES:
-        _ = load_profile(builtin_id)
+    # Ensure all builtin profiles exist (and are up to date) once per process;
+    # afterwards they are simply picked up from disk below
+    if not _BUILTINS_ENSURED:
+        for builtin_id in BUILTIN_PROFILES:
+            _ = load_profile(builtin_id)
+        _BUILTINS_ENSURED = True
     
     profiles: list[dict] = []
     invalid_files: list[Path] = []
     try:
-        for p in sorted(PROFILES_DIR.glob("*.json")):
-            if p.name == "ssh_users.json":
-                continue
-            with p.open("r", encoding="utf-8") as f:
-                profile = json.load(f)
+        # scandir yields the names (and cached file types) in one pass without Path objects
+        with os.scandir(PROFILES_DIR) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith(".json") and e.name != "ssh_users.json" and e.is_file()
+            ]
+        entries.sort(key=lambda e: e.name)
+        for entry in entries:
+            with open(entry.path, "rb") as f:
+                profile = orjson.loads(f.read())
+                if isinstance(profile, dict) and profile.get("id") in _pending_profiles:
+                    profile = copy.deepcopy(_pending_profiles[profile["id"]])
                 if (
                     isinstance(profile, dict)
                     and profile.get("id")
@@ -274,7 +399,7 @@ def list_profiles() -> list[dict]:
                 ):
                     profiles.append(profile)
                 else:
-                    invalid_files.append(p)
+                    invalid_files.append(Path(entry.path))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Profile konnten nicht gelesen werden: {exc}")
 
@@ -9,13 +9,13 @@ from services.api.routes.local_tsn_network import router as local_tsn_network_ro
 from services.api.routes.tabs import create_tabs_router
 
 
-def register_all_routers(app: FastAPI, *, tests_manager, load_profile):
+def register_all_routers(app: FastAPI, *, tests_manager, load_profile, profile_exists):
 	app.include_router(system_router)
 	app.include_router(license_router)
 	app.include_router(captures_router)
 	app.include_router(profiles_router)
 	app.include_router(ssh_router)
 	app.include_router(local_tsn_network_router)
-	app.include_router(create_tabs_router(tests_manager, load_profile))
+	app.include_router(create_tabs_router(tests_manager, load_profile, profile_exists))
 
 
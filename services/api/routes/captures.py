@@ -1,8 +1,7 @@
 from pathlib import Path
-from datetime import datetime, timezone
 
-from fastapi import APIRouter, Query, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query
+from fastapi.responses import FileResponse, StreamingResponse
 
 from services.api.deps import CAPTURE_DIR, capture_manager
 from services.api.enums import CaptureEvent, ErrorMessages
@@ -20,34 +19,56 @@ from services.api.utils.error_handling import (
 )
 from services.api.utils.metadata import MetadataService
 from services.api.utils.file_operations import (
-	create_zip_file,
+	check_file_path,
 	create_zip_response,
 	get_file_media_type,
-	validate_file_path,
 )
 from services.api.utils.capture_utils import (
+	list_capture_entries,
 	list_capture_files,
 	get_session_dir_and_base,
 	categorize_capture_files,
 	make_safe_filename,
 )
-from services.api.utils.process_utils import is_process_running
+from services.api.utils.process_utils import are_processes_running
+from services.api.profile_service import utcnow_iso
 from services.agent.capture_manager import write_capture_metadata
+import asyncio
+import csv
+import anyio
+import logging
 import os
 import signal
 import time
-import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# Dedicated thread limiter for bulk file I/O (ZIP streams, unlinks), so that
+# simultaneous downloads cannot exhaust the default threadpool of the API
+_io_limiter: anyio.CapacityLimiter | None = None
+
+
 def _get_metadata_service() -> MetadataService:
 	"""Helper to get MetadataService instance"""
 	return MetadataService(CAPTURE_DIR / "captures_meta.jsonl")
 
 
+def _get_io_limiter() -> anyio.CapacityLimiter:
+	global _io_limiter
+	if _io_limiter is None:
+		# Created lazily: older anyio versions need a running event loop for this
+		_io_limiter = anyio.CapacityLimiter(16)
+	return _io_limiter
+
+
+async def _run_io(func, *args):
+	"""Runs blocking file I/O in a worker thread bounded by the bulk I/O limiter"""
+	return await anyio.to_thread.run_sync(func, *args, limiter=_get_io_limiter())
+
+
 @router.get("/capture/status")
 def capture_status():
 	return capture_manager.status()
@@ -124,7 +145,7 @@ def stop_specific_capture(capture_id: str):
 			pass
 
 	# Write a stop event so the session is marked as ended
-	timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+	timestamp = utcnow_iso()
 	stop_row = {
 		"event": CaptureEvent.STOP.value,
 		"utc": timestamp,
@@ -164,6 +185,9 @@ def list_capture_sessions(limit: int | None = Query(default=None, gt=0)):
 	# Group by main_capture_id for multi-interface tests
 	grouped = metadata.group_by_main_capture()
 
+	# Process state of all captures without stop event, from a single check
+	running_pids = are_processes_running(row.get("pid") for cid, row in starts.items() if cid not in stops)
+
 	sessions = []
 	for main_id, capture_ids in grouped.items():
 		# Use first capture for main info
@@ -183,14 +207,11 @@ def list_capture_sessions(limit: int | None = Query(default=None, gt=0)):
 		# Additionally check if the process is actually still running
 		all_stopped = all_stopped_by_meta
 		if not all_stopped:
-			any_running = False
-			for cid in capture_ids:
-				if cid in stops:
-					continue
-				pid = starts[cid].get("pid")
-				if is_process_running(pid):
-					any_running = True
-					break
+			any_running = any(
+				running_pids[starts[cid].get("pid")]
+				for cid in capture_ids
+				if cid not in stops
+			)
 			all_stopped = not any_running
 		
 		sessions.append({
@@ -272,7 +293,7 @@ def get_capture_session(capture_id: str):
 		if interface not in files_by_interface:
 			files_by_interface[interface] = []
 		
-		capture_files = list_capture_files(s)
+		capture_files = list_capture_entries(s)
 		all_file_entries, meta_file_entries = categorize_capture_files(
 			capture_files, interface, cid
 		)
@@ -293,11 +314,12 @@ def get_capture_session(capture_id: str):
 	# Additionally check if the process is actually still running
 	all_stopped = all_stopped_by_meta
 	if not all_stopped:
-		any_running = any(
-			is_process_running(related_starts[cid].get("pid"))
+		running_pids = are_processes_running(
+			related_starts[cid].get("pid")
 			for cid in related_starts
 			if cid not in related_stops
 		)
+		any_running = any(running_pids.values())
 		all_stopped = not any_running
 
 	main_capture_id = start.get("main_capture_id") or capture_id
@@ -327,7 +349,11 @@ def get_capture_session(capture_id: str):
 
 @router.get("/captures/{capture_id}/download")
 @handle_generic_error(500, "Fehler beim Herunterladen der Capture")
-def download_capture(capture_id: str):
+async def download_capture(capture_id: str):
+	return await _run_io(_create_capture_zip_response, capture_id)
+
+
+def _create_capture_zip_response(capture_id: str) -> StreamingResponse:
 	metadata = _get_metadata_service()
 	metadata.ensure_exists()
 
@@ -348,7 +374,7 @@ def download_capture(capture_id: str):
 	short_id = capture_id.split('-')[0] if '-' in capture_id else capture_id[:8]
 	zip_name = f"capture_{short_id}.zip"
 
-	return create_zip_response(all_files, zip_name)
+	return create_zip_response(all_files, zip_name, limiter=_get_io_limiter())
 
 
 @router.get("/captures/{capture_id}/files/{filename}")
@@ -377,24 +403,27 @@ def download_single_pcap(capture_id: str, filename: str):
 
 	# Try to find the file in any of the valid base directories
 	for base_dir, base_name in valid_bases:
-		try:
-			candidate = validate_file_path(base_dir, filename, base_name)
-			media_type = get_file_media_type(candidate)
-			
-			return FileResponse(
-				path=str(candidate),
-				media_type=media_type,
-				filename=candidate.name,
-			)
-		except HTTPException:
+		candidate, error = check_file_path(base_dir, filename, base_name)
+		if error is not None:
 			continue
+		media_type = get_file_media_type(candidate)
+		
+		return FileResponse(
+			path=str(candidate),
+			media_type=media_type,
+			filename=candidate.name,
+		)
 
 	raise_not_found(ErrorMessages.FILE_NOT_FOUND)
 
 
 @router.post("/captures/{capture_id}/download")
 @handle_generic_error(500, "Fehler beim Herunterladen ausgewählter Dateien")
-def download_selected_as_zip(capture_id: str, payload: DownloadSelectedFilesPayload):
+async def download_selected_as_zip(capture_id: str, payload: DownloadSelectedFilesPayload):
+	return await _run_io(_create_selection_zip_response, capture_id, payload)
+
+
+def _create_selection_zip_response(capture_id: str, payload: DownloadSelectedFilesPayload) -> StreamingResponse:
 	if not payload.files:
 		raise_bad_request(ErrorMessages.NO_FILES_SELECTED)
 
@@ -423,13 +452,12 @@ def download_selected_as_zip(capture_id: str, payload: DownloadSelectedFilesPayl
 	for name in payload.files:
 		found = False
 		for base_dir, base_name in valid_bases:
-			try:
-				p = validate_file_path(base_dir, name, base_name)
+			# Misses are expected while probing the interfaces' directories: no raise per candidate
+			p, error = check_file_path(base_dir, name, base_name)
+			if error is None:
 				resolved_files.append(p)
 				found = True
 				break
-			except HTTPException:
-				continue
 		
 		if not found:
 			raise_not_found(ErrorMessages.file_not_found(name))
@@ -437,12 +465,16 @@ def download_selected_as_zip(capture_id: str, payload: DownloadSelectedFilesPayl
 	short_id = capture_id.split('-')[0] if '-' in capture_id else capture_id[:8]
 	zip_name = f"capture_{short_id}_selection.zip"
 
-	return create_zip_response(resolved_files, zip_name)
+	return create_zip_response(resolved_files, zip_name, limiter=_get_io_limiter())
 
 
 @router.post("/captures/bulk-download")
 @handle_generic_error(500, "Fehler beim Bulk-Download")
-def download_multiple_captures_as_zip(payload: BulkDownloadPayload):
+async def download_multiple_captures_as_zip(payload: BulkDownloadPayload):
+	return await _run_io(_create_bulk_zip_response, payload)
+
+
+def _create_bulk_zip_response(payload: BulkDownloadPayload) -> StreamingResponse:
 	if not payload.capture_ids:
 		raise_bad_request(ErrorMessages.NO_CAPTURE_IDS)
 
@@ -457,38 +489,61 @@ def download_multiple_captures_as_zip(payload: BulkDownloadPayload):
 	if not sessions:
 		raise_not_found("Keine der angegebenen Sessions gefunden")
 
-	timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+	# YYYYMMDDTHHMMSSZ -> YYYYMMDD_HHMMSS
+	timestamp = utcnow_iso()[:15].replace("T", "_")
 	zip_name = f"captures_bulk_{timestamp}.zip"
 
-	def add_bulk_files(zf):
-		for cap_id, session in sessions.items():
-			capture_files = list_capture_files(session)
-			if not capture_files:
-				continue
+	# One folder per session inside the archive
+	arcnames: dict[Path, str] = {}
+	for cap_id, session in sessions.items():
+		capture_files = list_capture_files(session)
+		if not capture_files:
+			continue
 
-			test_name = session.get("test_name") or session.get("interface") or "unknown"
-			safe_name = make_safe_filename(test_name)
-			short_id = cap_id.split('-')[0] if '-' in cap_id else cap_id[:8]
-			folder_name = f"{safe_name}_{short_id}"
+		test_name = session.get("test_name") or session.get("interface") or "unknown"
+		safe_name = make_safe_filename(test_name)
+		short_id = cap_id.split('-')[0] if '-' in cap_id else cap_id[:8]
+		folder_name = f"{safe_name}_{short_id}"
 
-			for p in capture_files:
-				arcname = f"{folder_name}/{p.name}"
-				zf.write(p, arcname=arcname)
+		for p in capture_files:
+			arcnames[p] = f"{folder_name}/{p.name}"
 
-	zip_path = create_zip_file(zip_name, add_bulk_files)
+	return create_zip_response(list(arcnames), zip_name, arcnames.__getitem__, limiter=_get_io_limiter())
+
+
+def _safe_unlink(file_path: Path) -> Exception | None:
+	"""Deletes a single file; returns the error instead of raising it."""
+	try:
+		file_path.unlink(missing_ok=True)
+		return None
+	except Exception as exc:
+		return exc
+
+
+def _read_keyed_rows(metadata: MetadataService) -> list[tuple[str, dict]]:
+	"""Reads all metadata rows together with their capture_id."""
+	return [(cid, row) for row, cid in metadata.iter_events()]
 
-	response = FileResponse(
-		path=str(zip_path),
-		media_type="application/zip",
-		filename=zip_name,
-	)
-	response.headers["Content-Disposition"] = f'attachment; filename="{zip_name}"'
-	return response
+
+def _remove_csv_metadata_rows(meta_csv: Path, deleted_set: frozenset[str]) -> None:
+	"""Removes all rows of the given capture_ids from the CSV metadata file."""
+	with meta_csv.open("r", encoding="utf-8", newline="") as f:
+		rows = list(csv.reader(f))
+	with meta_csv.open("w", encoding="utf-8", newline="") as f:
+		writer = csv.writer(f)
+		for csv_row in rows:
+			if not csv_row:
+				continue
+			# Start and stop rows have different column layouts (the header only
+			# reflects the first row), so match whole fields instead of one column
+			if not deleted_set.isdisjoint(csv_row):
+				continue
+			writer.writerow(csv_row)
 
 
 @router.delete("/captures/sessions")
 @handle_generic_error(500, "Fehler beim Löschen der Sessions")
-def delete_capture_sessions(payload: DeleteCaptureSessionsPayload):
+async def delete_capture_sessions(payload: DeleteCaptureSessionsPayload):
 	if not payload.capture_ids:
 		raise_bad_request(ErrorMessages.NO_CAPTURE_IDS)
 
@@ -503,18 +558,19 @@ def delete_capture_sessions(payload: DeleteCaptureSessionsPayload):
 
 	starts: dict[str, dict] = {}
 	stops: dict[str, dict] = {}
-	all_rows = metadata.read_all_rows()
+	# Keep each row with its capture_id so the rewrite below needs no second derivation
+	keyed_rows = await _run_io(_read_keyed_rows, metadata)
 	
-	for row in all_rows:
-		cid = row.get("capture_id") or f"pid-{row.get('pid')}"
+	for cid, row in keyed_rows:
 		event = row.get("event")
 		if event == CaptureEvent.START.value:
 			starts[cid] = row
 		elif event == CaptureEvent.STOP.value:
 			stops[cid] = row
 
-	deleted: list[str] = []
 	errors: dict[str, str] = {}
+	targets: list[tuple[str, Path]] = []
+	target_ids: list[str] = []
 
 	for capture_id in payload.capture_ids:
 		start = starts.get(capture_id)
@@ -527,47 +583,34 @@ def delete_capture_sessions(payload: DeleteCaptureSessionsPayload):
 			errors[capture_id] = "Session läuft noch (kein Stop-Event)"
 			continue
 
-		capture_files = list_capture_files(start)
+		capture_files = await _run_io(list_capture_files, start)
 		if not capture_files:
 			errors[capture_id] = ErrorMessages.NO_BASE_FILE
 			continue
 
-		try:
-			for file_path in capture_files:
-				try:
-					file_path.unlink()
-				except Exception:
-					pass
-			deleted.append(capture_id)
-		except Exception as exc:
+		target_ids.append(capture_id)
+		targets.extend((capture_id, file_path) for file_path in capture_files)
+
+	# Unlink all files concurrently so the filesystem work of rotated ring files overlaps
+	results = await asyncio.gather(*(_run_io(_safe_unlink, p) for _, p in targets))
+	for (capture_id, _), exc in zip(targets, results):
+		if exc is not None and capture_id not in errors:
 			errors[capture_id] = f"Fehler beim Löschen: {exc}"
 
+	deleted = [cid for cid in target_ids if cid not in errors]
+	if not deleted:
+		return {"deleted": deleted, "errors": errors}
+
 	# Rewrite metadata file without deleted sessions
-	remaining = [
-		row for row in all_rows
-		if (row.get("capture_id") or f"pid-{row.get('pid')}") not in deleted
-	]
-	metadata.write_all_rows(remaining)
+	deleted_set = frozenset(deleted)
+	remaining = [row for cid, row in keyed_rows if cid not in deleted_set]
+	await _run_io(metadata.write_all_rows, remaining)
 	
 	# Optional: clean up CSV metadata
 	if meta_csv.exists():
 		try:
-			lines = meta_csv.read_text(encoding="utf-8").splitlines()
-			with meta_csv.open("w", encoding="utf-8") as f:
-				for ln in lines:
-					if not ln.strip():
-						continue
-					# Simple filtering: search for capture_id in CSV
-					keep = True
-					for cid in deleted:
-						if cid in ln:
-							keep = False
-							break
-					if keep:
-						f.write(ln + "\n")
+			await _run_io(_remove_csv_metadata_rows, meta_csv, deleted_set)
 		except Exception:
 			pass
 
 	return {"deleted": deleted, "errors": errors}
-
-
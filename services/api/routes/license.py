@@ -1,27 +1,119 @@
 from fastapi import APIRouter, HTTPException
 import ast
-import re
+import asyncio
+import contextlib
+import os
+import shutil
+import string
 import subprocess
+import time
 
 from services.api.utils.parsing import parse_enabled_disabled_line, parse_int_maybe_hex, strip_ansi_sequences
 
 router = APIRouter(prefix="/license")
 
+# The FPGA status changes slowly, while the dashboard polls it; results are reused for a
+# short time as long as the status script itself was not replaced
+_FPGA_STATUS_TTL_S = 2.0
+_fpga_status_cache: dict[str, object] = {"cmd": None, "mtime": None, "ts": 0.0, "data": None}
+# Last working command per candidate list, tried first on the next call
+_resolved_cmds: dict[str, list[str]] = {}
+_fpga_status_lock = asyncio.Lock()
+# Characters allowed in the key of KEY=VALUE status lines
+_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_")
 
-def _run_first_available(candidate_cmds: list[list[str]]) -> subprocess.CompletedProcess[str] | None:
+
+async def _run_cmd(cmd: list[str]) -> subprocess.CompletedProcess | None:
+	try:
+		proc = await asyncio.create_subprocess_exec(
+			*cmd,
+			stdout=asyncio.subprocess.PIPE,
+			stderr=asyncio.subprocess.PIPE,
+		)
+	except Exception:  # noqa: BLE001
+		return None
+	try:
+		stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+	except asyncio.TimeoutError:
+		with contextlib.suppress(ProcessLookupError):
+			proc.kill()
+		await proc.wait()
+		return None
+	except asyncio.CancelledError:
+		with contextlib.suppress(ProcessLookupError):
+			proc.kill()
+		# Reap the process even if the caller is cancelled again while waiting
+		await asyncio.shield(proc.wait())
+		raise
+	# stdout is decoded in one pass; stderr stays raw and is only decoded for error messages
+	result = subprocess.CompletedProcess(
+		cmd,
+		proc.returncode,
+		stdout.decode("utf-8", errors="replace"),
+		stderr,
+	)
+	if result.returncode == 0 or result.stdout.strip():
+		return result
+	return None
+
+
+def _cmd_target(cmd: list[str]) -> str | None:
+	"""
+	Real path of the script/binary a command runs, None if it cannot be started
+	(not found, not executable, or its interpreter is missing).
+	"""
+	if len(cmd) == 1:
+		target = shutil.which(cmd[0])
+	else:
+		# "<interpreter> <script>": the script only has to exist
+		target = cmd[-1] if shutil.which(cmd[0]) and os.path.isfile(cmd[-1]) else None
+	return os.path.realpath(target) if target else None
+
+
+async def _run_first_available(candidate_cmds: list[list[str]], cache_key: str) -> subprocess.CompletedProcess | None:
+	resolved = _resolved_cmds.get(cache_key)
+	if resolved is not None:
+		proc = await _run_cmd(resolved)
+		if proc is not None:
+			return proc
+		_resolved_cmds.pop(cache_key, None)
+	# Probe in priority order, one at a time: candidates that cannot be started are
+	# skipped without spawning, and each script runs at most once even if several
+	# candidates (PATH lookup, absolute path, via bash) point to the same file
+	tried: set[str] = set()
 	for cmd in candidate_cmds:
-		try:
-			proc = subprocess.run(
-				cmd,
-				capture_output=True,
-				text=True,
-				timeout=10,
-				check=False,
-			)
-			if proc.returncode == 0 or (proc.stdout and proc.stdout.strip()):
-				return proc
-		except Exception:  # noqa: BLE001
+		if cmd == resolved:
 			continue
+		target = _cmd_target(cmd)
+		if target is None or target in tried:
+			continue
+		tried.add(target)
+		proc = await _run_cmd(cmd)
+		if proc is not None:
+			_resolved_cmds[cache_key] = cmd
+			return proc
+	return None
+
+
+def _cmd_mtime(cmd: list[str] | None) -> float | None:
+	"""Modification time of the script/binary a command runs, None if unknown."""
+	if not cmd:
+		return None
+	target = cmd[-1]
+	try:
+		return os.stat(shutil.which(target) or target).st_mtime
+	except OSError:
+		return None
+
+
+def _cached_fpga_status() -> dict[str, object] | None:
+	cache = _fpga_status_cache
+	if (
+		cache["data"] is not None
+		and time.monotonic() - cache["ts"] < _FPGA_STATUS_TTL_S
+		and _cmd_mtime(cache["cmd"]) == cache["mtime"]
+	):
+		return cache["data"]
 	return None
 
 
@@ -51,14 +143,18 @@ def _literal_after_marker(text: str, marker: str) -> object | None:
 
 def _parse_key_value_output(stdout: str) -> dict[str, object]:
 	raw: dict[str, object] = {}
-	for line in [line.rstrip() for line in stdout.splitlines() if line.strip()]:
-		if ":" in line:
-			key, val = line.split(":", 1)
+	for line in stdout.splitlines():
+		line = line.rstrip()
+		if not line:
+			continue
+		key, sep, val = line.partition(":")
+		if sep:
 			raw[key.strip()] = val.strip()
 			continue
-		match = re.match(r"^(?P<key>[A-Za-z0-9_]+)=(?P<val>.*)$", line)
-		if match:
-			raw[match.group("key")] = match.group("val").strip()
+		key, sep, val = line.partition("=")
+		# KEY=VALUE lines only count with a plain [A-Za-z0-9_] key
+		if sep and key and _KEY_CHARS.issuperset(key):
+			raw[key] = val.strip()
 	return raw
 
 
@@ -81,6 +177,28 @@ def _parse_license_features(stdout: str) -> list[dict[str, object]]:
 	return features
 
 
+# Plain register fields: raw key -> decoded key, value parsed as (hex) integer
+_REGISTER_FIELDS = {
+	key: key.lower()
+	for key in (
+		"INT_SET_EN",
+		"INT_CLR_EN",
+		"FPGA_ALARM",
+		"CONFIG_CHECK",
+		"ACCESS_ERROR",
+		"FIFO_OVERFLOW",
+		"FIFO_UNDERRUN",
+		"EXT_INTERRUPT",
+		"MMI_INT_BITMAP",
+		"BACKPRESSURE",
+		"RESET",
+		"TEST_DRIVE",
+		"TEST_VALUE",
+		"FEATURE_MAP",
+	)
+}
+
+
 def _normalise_status(raw: dict[str, object], license_features: list[dict[str, object]]) -> dict[str, object]:
 	def value(*keys: str) -> object | None:
 		for key in keys:
@@ -142,34 +260,31 @@ def _normalise_status(raw: dict[str, object], license_features: list[dict[str, o
 	decoded["license_features"] = normalised_features
 	decoded["feature_licenses_enabled"] = any(feature["status"] for feature in normalised_features)
 
-	for field in [
-		"INT_SET_EN",
-		"INT_CLR_EN",
-		"FPGA_ALARM",
-		"CONFIG_CHECK",
-		"ACCESS_ERROR",
-		"FIFO_OVERFLOW",
-		"FIFO_UNDERRUN",
-		"EXT_INTERRUPT",
-		"MMI_INT_BITMAP",
-		"BACKPRESSURE",
-		"RESET",
-		"TEST_DRIVE",
-		"TEST_VALUE",
-		"FEATURE_MAP",
-	]:
-		field_value = value(field)
-		if field_value is not None:
-			decoded[field.lower()] = parse_int_maybe_hex(str(field_value))
+	for key, field_value in raw.items():
+		field = _REGISTER_FIELDS.get(key)
+		if field is not None and field_value is not None:
+			decoded[field] = parse_int_maybe_hex(str(field_value))
 
 	return decoded
 
 
 @router.get("/fpga_status", operation_id="license_get_fpga_status")
-def get_fpga_status():
+async def get_fpga_status():
 	"""
 	Read RealTimeHAT FPGA status and feature-license information.
 	"""
+	cached = _cached_fpga_status()
+	if cached is not None:
+		return cached
+	# Concurrent requests wait for a single probe instead of starting their own
+	async with _fpga_status_lock:
+		cached = _cached_fpga_status()
+		if cached is not None:
+			return cached
+		return await _read_fpga_status()
+
+
+async def _read_fpga_status() -> dict[str, object]:
 	status_cmds = [
 		["/usr/local/bin/INR_FPGA_status"],
 		["INR_FPGA_status"],
@@ -185,11 +300,11 @@ def get_fpga_status():
 		["INR_FPGA_license"],
 	]
 
-	proc = _run_first_available(status_cmds)
+	proc = await _run_first_available(status_cmds, "status")
 	if proc is None:
 		raise HTTPException(status_code=404, detail="INR_FPGA_status/INR_fpga_status script not found or not executable")
 	if proc.returncode not in (0,) and not (proc.stdout and proc.stdout.strip()):
-		raise HTTPException(status_code=500, detail=f"Script error ({proc.returncode}): {proc.stderr.strip()}")
+		raise HTTPException(status_code=500, detail=f"Script error ({proc.returncode}): {proc.stderr.decode('utf-8', errors='replace').strip()}")
 
 	status_stdout = proc.stdout or ""
 	raw_obj = _literal_after_marker(status_stdout, "FPGA status:")
@@ -199,7 +314,7 @@ def get_fpga_status():
 	license_features = features_obj if isinstance(features_obj, list) else []
 	license_stdout = ""
 	if not license_features:
-		license_proc = _run_first_available(license_cmds)
+		license_proc = await _run_first_available(license_cmds, "license")
 		if license_proc and license_proc.stdout:
 			license_stdout = license_proc.stdout
 			license_features = _parse_license_features(license_proc.stdout)
@@ -212,4 +327,7 @@ def get_fpga_status():
 		"license_output": license_stdout,
 	}
 	response.update(decoded)
+
+	status_cmd = _resolved_cmds.get("status")
+	_fpga_status_cache.update(cmd=status_cmd, mtime=_cmd_mtime(status_cmd), ts=time.monotonic(), data=response)
 	return response
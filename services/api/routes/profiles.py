@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from uuid import uuid4
 from fastapi import APIRouter, Body, HTTPException
 from services.api.profile_service import (
@@ -8,6 +9,8 @@ from services.api.profile_service import (
 	list_profiles,
 	profile_path,
 	ensure_profiles_dir,
+	invalidate_profile_cache,
+	queue_profile_write,
 	utcnow_iso,
 	BUILTIN_PROFILES,
 )
@@ -49,8 +52,8 @@ def api_create_test_profile(payload: dict = Body()):  # type: ignore[type-arg]
 
 
 @router.put("/test-profiles/{profile_id}")
-def api_update_test_profile(profile_id: str, payload: dict = Body()):  # type: ignore[type-arg]
-	current = load_profile(profile_id)
+async def api_update_test_profile(profile_id: str, payload: dict = Body()):  # type: ignore[type-arg]
+	current = await asyncio.to_thread(load_profile, profile_id)
 	is_builtin = profile_id in BUILTIN_PROFILES
 	
 	if is_builtin:
@@ -71,15 +74,9 @@ def api_update_test_profile(profile_id: str, payload: dict = Body()):  # type: i
 		updated["isDefault"] = True
 		updated["id"] = profile_id
 		
-		# Direkt in die Datei schreiben, ohne save_profile (da Builtin)
-		from services.api.profile_service import profile_path
-		import json
-		path = profile_path(profile_id)
-		try:
-			with path.open("w", encoding="utf-8") as f:
-				json.dump(updated, f, ensure_ascii=False, indent=2)
-		except Exception as exc:  # noqa: BLE001
-			raise HTTPException(status_code=500, detail=f"Profil konnte nicht aktualisiert werden: {exc}")
+		# Ohne save_profile (da Builtin) verzögert schreiben, damit schnelle
+		# aufeinanderfolgende Änderungen zu einem Schreibvorgang zusammengefasst werden
+		queue_profile_write(profile_id, updated)
 		return updated
 	else:
 		# Normale Profile können vollständig bearbeitet werden
@@ -95,7 +92,7 @@ def api_update_test_profile(profile_id: str, payload: dict = Body()):  # type: i
 		}
 		updated["isDefault"] = False
 		updated["id"] = profile_id
-		return save_profile(updated, overwrite=True)
+		return await asyncio.to_thread(save_profile, updated, overwrite=True)
 
 
 @router.delete("/test-profiles/{profile_id}")
@@ -110,6 +107,8 @@ def api_delete_test_profile(profile_id: str):
 		path.unlink(missing_ok=True)
 	except Exception as exc:  # noqa: BLE001
 		raise HTTPException(status_code=500, detail=f"Profil konnte nicht gelöscht werden: {exc}")
+	finally:
+		invalidate_profile_cache(profile_id)
 	return {"deleted": True}
 
 
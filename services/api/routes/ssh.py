@@ -1,17 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import contextlib
-import json
 from typing import Any
 
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout as async_timeout
+
+import orjson
 from fastapi import APIRouter, Body, HTTPException, WebSocket, WebSocketDisconnect
 
-from services.api.ssh_service import load_users, sanitize_username, save_users
+from services.api.ssh_service import add_user, load_users, remove_user, sanitize_username
 
 
 router = APIRouter(prefix="/ssh")
 
+# SSH output pump: read size, max. bytes merged into one WebSocket frame and how long
+# to wait for follow-up output before the collected frame is sent
+PUMP_READ_SIZE = 65536
+PUMP_MAX_FRAME_BYTES = 256 * 1024
+PUMP_BATCH_WAIT_S = 0.002
+
+# Idle time without client input after which a keepalive ping is sent
+SSH_IDLE_PING_S = 60
+
 
 @router.get("/users")
 def api_list_ssh_users():
@@ -22,28 +37,21 @@ def api_list_ssh_users():
 
 
 @router.post("/users")
-def api_create_ssh_user(payload: dict = Body()):  # type: ignore[type-arg]
+async def api_create_ssh_user(payload: dict = Body()):  # type: ignore[type-arg]
     raw = str(payload.get("username") or "")
     username = sanitize_username(raw)
     if not username:
         raise HTTPException(status_code=400, detail="'username' ist erforderlich")
-    users = load_users()
-    if username in users:
+    if not add_user(username):
         raise HTTPException(status_code=409, detail="Nutzer existiert bereits")
-    users.append(username)
-    users = sorted(set(users), key=lambda value: value.lower())
-    save_users(users)
     return {"username": username}
 
 
 @router.delete("/users/{username}")
-def api_delete_ssh_user(username: str):
+async def api_delete_ssh_user(username: str):
     name = sanitize_username(username)
-    users = load_users()
-    if name not in users:
+    if not remove_user(name):
         raise HTTPException(status_code=404, detail="Nutzer nicht gefunden")
-    users = [user for user in users if user != name]
-    save_users(users)
     return {"deleted": True}
 
 
@@ -74,7 +82,7 @@ async def ssh_websocket(ws: WebSocket):  # pragma: no cover - interactive
         if message:
             payload["message"] = message
         with contextlib.suppress(Exception):
-            await ws.send_text(json.dumps(payload))
+            await ws.send_text(orjson.dumps(payload).decode())
 
     async def close_all() -> None:
         nonlocal stdout_task, wait_task, process
@@ -99,7 +107,7 @@ async def ssh_websocket(ws: WebSocket):  # pragma: no cover - interactive
         await send_status("connecting")
         initial = await ws.receive_text()
         try:
-            msg = json.loads(initial)
+            msg = orjson.loads(initial)
         except Exception:
             await send_status("error", "Ungueltige Startnachricht")
             await ws.close()
@@ -162,12 +170,32 @@ async def ssh_websocket(ws: WebSocket):  # pragma: no cover - interactive
 
         async def pump_stdout() -> None:
             assert process is not None and process.stdout is not None
+            stdout = process.stdout
+            # Incremental decoding keeps multi-byte characters intact across read boundaries
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
             try:
-                while True:
-                    data = await process.stdout.read(4096)
+                eof = False
+                while not eof:
+                    data = await stdout.read(PUMP_READ_SIZE)
                     if not data:
                         break
-                    await ws.send_text(json.dumps({"type": "output", "data": data.decode('utf-8', errors='replace')}))
+                    # Bulk output (e.g. cat of a large file): collect what arrives right
+                    # after the first chunk, so it is sent as one frame instead of many
+                    buf = bytearray(data)
+                    while len(buf) < PUMP_MAX_FRAME_BYTES:
+                        try:
+                            async with async_timeout(PUMP_BATCH_WAIT_S):
+                                more = await stdout.read(PUMP_READ_SIZE)
+                        except asyncio.TimeoutError:
+                            break
+                        if not more:
+                            eof = True
+                            break
+                        buf += more
+                    text = decoder.decode(bytes(buf), final=eof)
+                    if text:
+                        # send_text awaits the transport, which throttles the pump for slow clients
+                        await ws.send_text(orjson.dumps({"type": "output", "data": text}).decode())
             except asyncio.CancelledError:
                 pass
             except Exception:
@@ -186,28 +214,44 @@ async def ssh_websocket(ws: WebSocket):  # pragma: no cover - interactive
         stdout_task = asyncio.create_task(pump_stdout())
         wait_task = asyncio.create_task(watch_process())
 
+        stdin = process.stdin
+        ping_frame = orjson.dumps({"type": "ping"}).decode()
         while True:
             try:
-                msg_text = await ws.receive_text()
+                async with async_timeout(SSH_IDLE_PING_S):
+                    msg_text = await ws.receive_text()
+            except asyncio.TimeoutError:
+                # Idle terminal: stop if ssh is gone, otherwise keep proxies from dropping the socket
+                if process.returncode is not None:
+                    break
+                try:
+                    await ws.send_text(ping_frame)
+                except Exception:
+                    break
+                continue
             except WebSocketDisconnect:
                 break
             except Exception:
                 break
 
             try:
-                message = json.loads(msg_text)
-            except Exception:
+                message = orjson.loads(msg_text)
+            except orjson.JSONDecodeError:
                 continue
 
-            if not isinstance(message, dict):
+            # Hot path (one message per keystroke): exact type checks, no coercion for str input
+            if type(message) is not dict:
                 continue
 
             msg_type = message.get("type")
             if msg_type == "input":
-                if process is not None and process.stdin is not None and "data" in message:
+                if stdin is not None and "data" in message:
+                    data = message["data"]
+                    if type(data) is not str:
+                        data = str(data or "")
                     with contextlib.suppress(Exception):
-                        process.stdin.write(str(message.get("data") or "").encode("utf-8", errors="replace"))
-                        await process.stdin.drain()
+                        stdin.write(data.encode("utf-8", errors="replace"))
+                        await stdin.drain()
             elif msg_type == "resize":
                 continue
             elif msg_type == "disconnect":
@@ -1,7 +1,10 @@
 from fastapi import APIRouter
+import asyncio
+import contextlib
 import psutil
 import shutil
 import socket
+import time
 
 from services.api.enums import ErrorMessages
 from services.api.utils.error_handling import handle_generic_error, raise_internal_error
@@ -12,12 +15,97 @@ router = APIRouter()
 # Cache for network IO statistics
 _network_stats_cache = {}
 
+# Conversion factor from bytes to Mbit
+_BYTES_TO_MBIT = 8 / (1024 * 1024)
+
+# Hostname and LAN IP only change rarely, so /system/info reuses them for a while
+_SYSINFO_TTL_S = 60.0
+_sysinfo_cache = {"ts": 0.0, "hostname": None, "ip": None}
+
+# Interface addresses and link stats change rarely; byte counters stay live
+_IFACE_DETAILS_TTL_S = 5.0
+_iface_details_cache = {"ts": 0.0, "details": None}
+_NO_IFACE_DETAILS = {"is_up": False, "mtu": None, "speed": None, "addresses": []}
+
+# CPU usage is sampled once per second in the background instead of blocking
+# every /system/resources request for a second
+_CPU_SAMPLE_INTERVAL_S = 1.0
+_cpu_percent = 0.0
+_cpu_sampler_task: asyncio.Task | None = None
+
+# Prime psutil so the first non-blocking sample has a reference point
+psutil.cpu_percent(interval=None)
+
+
+async def _sample_cpu_percent() -> None:
+	global _cpu_percent
+	while True:
+		await asyncio.sleep(_CPU_SAMPLE_INTERVAL_S)
+		_cpu_percent = psutil.cpu_percent(interval=None)
+
+
+def start_cpu_sampler() -> None:
+	"""
+	Starts the background CPU sampler (called on application startup).
+	"""
+	global _cpu_sampler_task
+	if _cpu_sampler_task is None or _cpu_sampler_task.done():
+		_cpu_sampler_task = asyncio.create_task(_sample_cpu_percent())
+
+
+async def stop_cpu_sampler() -> None:
+	"""
+	Stops the background CPU sampler (called on application shutdown).
+	"""
+	global _cpu_sampler_task
+	task, _cpu_sampler_task = _cpu_sampler_task, None
+	if task is not None:
+		task.cancel()
+		with contextlib.suppress(asyncio.CancelledError):
+			await task
+
 
 @router.get("/health")
 def health():
 	return {"status": "ok"}
 
 
+def _default_route_interface() -> str | None:
+	"""
+	Returns the interface of the IPv4 default route from /proc/net/route.
+	"""
+	try:
+		with open('/proc/net/route') as f:
+			next(f, None)
+			for line in f:
+				fields = line.split()
+				# Destination 00000000 = default route, flag 0x2 = RTF_GATEWAY
+				if len(fields) > 3 and fields[1] == '00000000' and int(fields[3], 16) & 0x2:
+					return fields[0]
+	except (OSError, ValueError):
+		pass
+	return None
+
+
+def _get_primary_ip() -> str | None:
+	"""
+	Determines the LAN IP address of the default-route interface.
+	"""
+	iface = _default_route_interface()
+	if iface:
+		for addr in psutil.net_if_addrs().get(iface, ()):
+			if addr.family == socket.AF_INET:
+				return addr.address
+	
+	# Fallback: connect to a dummy address to determine the IP
+	try:
+		with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+			s.connect(('8.8.8.8', 80))
+			return s.getsockname()[0]
+	except Exception:
+		return None
+
+
 @router.get("/system/info")
 @handle_generic_error(500, ErrorMessages.SYSTEM_INFO_ERROR)
 def get_system_info():
@@ -26,15 +114,13 @@ def get_system_info():
 	"""
 	hostname = socket.gethostname()
 	
-	# Get IP address
-	try:
-		# Connect to a dummy address to determine the IP
-		s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-		s.connect(('8.8.8.8', 80))
-		ip_address = s.getsockname()[0]
-		s.close()
-	except Exception:
-		ip_address = None
+	# Get IP address (cached, refreshed after TTL or a hostname change)
+	now = time.monotonic()
+	if hostname == _sysinfo_cache["hostname"] and now - _sysinfo_cache["ts"] < _SYSINFO_TTL_S:
+		ip_address = _sysinfo_cache["ip"]
+	else:
+		ip_address = _get_primary_ip()
+		_sysinfo_cache.update(ts=now, hostname=hostname, ip=ip_address)
 	
 	# Boot time for uptime calculation
 	boot_time = psutil.boot_time()
@@ -56,7 +142,10 @@ def get_system_resources():
 	"""
 	Returns current system resources (CPU, RAM, storage) of the Raspberry Pi.
 	"""
-	cpu_percent = psutil.cpu_percent(interval=1)
+	if _cpu_sampler_task is not None and not _cpu_sampler_task.done():
+		cpu_percent = _cpu_percent
+	else:
+		cpu_percent = psutil.cpu_percent(interval=None)
 
 	memory = psutil.virtual_memory()
 	memory_percent = memory.percent
@@ -99,119 +188,97 @@ def get_system_resources():
 	}
 
 
+def _get_interface_details() -> dict:
+	"""
+	Returns link state and formatted addresses per interface (cached for a few seconds).
+	"""
+	now = time.monotonic()
+	details = _iface_details_cache["details"]
+	if details is not None and now - _iface_details_cache["ts"] < _IFACE_DETAILS_TTL_S:
+		return details
+	
+	net_if_addrs = psutil.net_if_addrs()
+	net_if_stats = psutil.net_if_stats()
+	details = {}
+	for iface_name in net_if_addrs.keys() | net_if_stats.keys():
+		stats = net_if_stats.get(iface_name)
+		details[iface_name] = {
+			"is_up": stats.isup if stats else False,
+			"mtu": stats.mtu if stats else None,
+			"speed": stats.speed if stats else None,
+			"addresses": [
+				{
+					"family": str(addr.family),
+					"address": addr.address,
+					"netmask": addr.netmask if addr.netmask else None,
+					"broadcast": addr.broadcast if addr.broadcast else None
+				}
+				for addr in net_if_addrs.get(iface_name, ())
+			]
+		}
+	_iface_details_cache.update(ts=now, details=details)
+	return details
+
+
 @router.get("/system/interfaces")
 @handle_generic_error(500, ErrorMessages.NETWORK_INTERFACES_ERROR)
 def get_network_interfaces():
 	"""
 	Returns information about all network interfaces.
 	"""
-	import time
+	global _network_stats_cache
 	
 	interfaces: list[dict] = []
-	net_if_addrs = psutil.net_if_addrs()
-	net_if_stats = psutil.net_if_stats()
+	iface_details = _get_interface_details()
 	
 	# Current IO statistics
 	current_io = psutil.net_io_counters(pernic=True)
 	current_time = time.time()
 	
-	if not _network_stats_cache:
-		# First request - initialize cache
-		for iface_name in current_io.keys():
-			_network_stats_cache[iface_name] = {
-				"last_update": current_time,
-				"prev_bytes_sent": current_io[iface_name].bytes_sent,
-				"prev_bytes_recv": current_io[iface_name].bytes_recv
-			}
-		
-		# Don't calculate rates immediately after initialization
-		for iface_name in current_io.keys():
-			stats = net_if_stats.get(iface_name)
-			addrs = net_if_addrs.get(iface_name)
-			
-			iface_info: dict = {
-				"name": iface_name,
-				"is_up": stats.isup if stats else False,
-				"mtu": stats.mtu if stats else None,
-				"speed": stats.speed if stats else None,
-				"rate_sent_mbps": 0.0,
-				"rate_recv_mbps": 0.0,
-				"total_bytes_sent": current_io[iface_name].bytes_sent,
-				"total_bytes_recv": current_io[iface_name].bytes_recv,
-				"addresses": []
-			}
-			
-			if addrs:
-				for addr in addrs:
-					iface_info["addresses"].append({
-						"family": str(addr.family),
-						"address": addr.address,
-						"netmask": addr.netmask if addr.netmask else None,
-						"broadcast": addr.broadcast if addr.broadcast else None
-					})
-			
-			interfaces.append(iface_info)
-		
-		return {"interfaces": interfaces}
+	# Concurrent requests run in the threadpool: build a new cache and swap it in
+	# with one assignment instead of mutating entries another request is reading
+	prev_stats = _network_stats_cache
+	new_stats = {}
 	
-	# Calculate rates based on elapsed time
-	for iface_name in current_io.keys():
-		stats = net_if_stats.get(iface_name)
-		addrs = net_if_addrs.get(iface_name)
-		current_bytes_sent = current_io[iface_name].bytes_sent
-		current_bytes_recv = current_io[iface_name].bytes_recv
+	for iface_name, io in current_io.items():
+		details = iface_details.get(iface_name, _NO_IFACE_DETAILS)
+		current_bytes_sent = io.bytes_sent
+		current_bytes_recv = io.bytes_recv
 		
-		# Calculate rate
+		# Calculate rate (0 on the first request and for new interfaces)
 		rate_sent_mbps = 0.0
 		rate_recv_mbps = 0.0
 		
-		if iface_name in _network_stats_cache:
-			cache = _network_stats_cache[iface_name]
-			time_diff = current_time - cache["last_update"]
+		prev = prev_stats.get(iface_name)
+		if prev is not None:
+			time_diff = current_time - prev["last_update"]
 			
 			if time_diff > 0:
-				bytes_sent_diff = max(0, current_bytes_sent - cache["prev_bytes_sent"])
-				bytes_recv_diff = max(0, current_bytes_recv - cache["prev_bytes_recv"])
-				
-				# Convert from bytes to Mbps
-				rate_sent_mbps = (bytes_sent_diff * 8) / (1024 * 1024) / time_diff
-				rate_recv_mbps = (bytes_recv_diff * 8) / (1024 * 1024) / time_diff
-			
-			# Update cache
-			cache["last_update"] = current_time
-			cache["prev_bytes_sent"] = current_bytes_sent
-			cache["prev_bytes_recv"] = current_bytes_recv
-		else:
-			# New interface
-			_network_stats_cache[iface_name] = {
-				"last_update": current_time,
-				"prev_bytes_sent": current_bytes_sent,
-				"prev_bytes_recv": current_bytes_recv
-			}
+				# Convert from bytes to Mbps (one factor for both directions)
+				mbps_factor = _BYTES_TO_MBIT / time_diff
+				rate_sent_mbps = max(0, current_bytes_sent - prev["prev_bytes_sent"]) * mbps_factor
+				rate_recv_mbps = max(0, current_bytes_recv - prev["prev_bytes_recv"]) * mbps_factor
+		
+		new_stats[iface_name] = {
+			"last_update": current_time,
+			"prev_bytes_sent": current_bytes_sent,
+			"prev_bytes_recv": current_bytes_recv
+		}
 		
 		iface_info: dict = {
 			"name": iface_name,
-			"is_up": stats.isup if stats else False,
-			"mtu": stats.mtu if stats else None,
-			"speed": stats.speed if stats else None,
+			"is_up": details["is_up"],
+			"mtu": details["mtu"],
+			"speed": details["speed"],
 			"rate_sent_mbps": round(rate_sent_mbps, 3),
 			"rate_recv_mbps": round(rate_recv_mbps, 3),
 			"total_bytes_sent": current_bytes_sent,
 			"total_bytes_recv": current_bytes_recv,
-			"addresses": []
+			"addresses": details["addresses"]
 		}
 		
-		if addrs:
-			for addr in addrs:
-				iface_info["addresses"].append({
-					"family": str(addr.family),
-					"address": addr.address,
-					"netmask": addr.netmask if addr.netmask else None,
-					"broadcast": addr.broadcast if addr.broadcast else None
-				})
-		
 		interfaces.append(iface_info)
 	
+	_network_stats_cache = new_stats
+	
 	return {"interfaces": interfaces, "timestamp": current_time}
-
-
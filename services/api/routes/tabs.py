@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 import asyncio
 import contextlib
+import orjson
 
 from services.api.schemas import (
 	CreateTestTabPayload,
@@ -17,8 +19,11 @@ from services.api.utils.error_handling import (
 	raise_internal_error,
 )
 
+# Log entries per NDJSON chunk
+LOG_STREAM_BATCH = 256
 
-def create_tabs_router(tests_manager, load_profile_func):
+
+def create_tabs_router(tests_manager, load_profile_func, profile_exists_func):
 	router = APIRouter(prefix="/test-tabs")
 
 	@router.get("")
@@ -28,10 +33,8 @@ def create_tabs_router(tests_manager, load_profile_func):
 	@router.post("")
 	async def api_create_test_tab(payload: CreateTestTabPayload):
 		if payload.profileId:
-			# Validation: Profile must exist
-			try:
-				load_profile_func(payload.profileId)
-			except (FileNotFoundError, KeyError, ValueError):
+			# Validation: Profile must exist (content is only loaded on start)
+			if not profile_exists_func(payload.profileId):
 				raise_not_found(f"Profil nicht gefunden: {payload.profileId}")
 		
 		try:
@@ -47,9 +50,7 @@ def create_tabs_router(tests_manager, load_profile_func):
 	@router.put("/{tab_id}")
 	async def api_update_test_tab(tab_id: str, payload: UpdateTestTabPayload):
 		if payload.profileId:
-			try:
-				load_profile_func(payload.profileId)
-			except (FileNotFoundError, KeyError, ValueError):
+			if not profile_exists_func(payload.profileId):
 				raise_not_found(f"Profil nicht gefunden: {payload.profileId}")
 		
 		try:
@@ -106,7 +107,30 @@ def create_tabs_router(tests_manager, load_profile_func):
 			raise_not_found(ErrorMessages.TAB_NOT_FOUND)
 
 	@router.get("/{tab_id}/logs")
-	async def api_get_test_tab_logs(tab_id: str, after: int | None = Query(default=None, ge=0)):
+	async def api_get_test_tab_logs(request: Request, tab_id: str, after: int | None = Query(default=None, ge=0)):
+		# Clients asking for NDJSON get one entry per line, streamed (lastSeq as header)
+		if "application/x-ndjson" in request.headers.get("accept", ""):
+			try:
+				last_seq, entries = await tests_manager.get_logs_iter(tab_id, after=after)
+			except KeyError:
+				raise_not_found(ErrorMessages.TAB_NOT_FOUND)
+			async def ndjson_chunks():
+				# Several lines per chunk: a sync iterator would cost one threadpool hop per line
+				batch = bytearray()
+				for count, entry in enumerate(entries, 1):
+					batch += orjson.dumps(entry)
+					batch += b"\n"
+					if count % LOG_STREAM_BATCH == 0:
+						yield bytes(batch)
+						batch.clear()
+				if batch:
+					yield bytes(batch)
+
+			return StreamingResponse(
+				ndjson_chunks(),
+				media_type="application/x-ndjson",
+				headers={"X-Last-Seq": str(last_seq)},
+			)
 		try:
 			return await tests_manager.get_logs(tab_id, after=after)
 		except KeyError:
@@ -117,15 +141,14 @@ def create_tabs_router(tests_manager, load_profile_func):
 		await ws.accept()
 		queue = await tests_manager.subscribe()
 		try:
-			snapshot = await tests_manager.list_tabs()
-			await ws.send_json({"type": "snapshot", "tabs": snapshot})
+			await ws.send_text(await tests_manager.snapshot_frame())
 			while True:
 				try:
-					event = await queue.get()
+					frame = await queue.get()
 				except asyncio.CancelledError:
 					break
 				try:
-					await ws.send_json(event)
+					await ws.send_text(frame)
 				except WebSocketDisconnect:
 					break
 				except Exception:
@@ -3,22 +3,51 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable
 from uuid import uuid4
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 import asyncio
 import contextlib
-import json
-import re
+import heapq
+import time
 
-from apscheduler.jobstores.base import JobLookupError
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.date import DateTrigger
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout as async_timeout
 
-from fastapi import APIRouter, Body, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from services.api.enums import ScheduleType, RunStatus
+from services.api.schemas import UpsertSchedulePayload
 
 
 ScheduleRule = dict  # {'type': 'once'|'weekly', ...}
 
+# Änderungen werden gesammelt und kurz danach in einem Schreibvorgang gespeichert
+SCHEDULE_SAVE_DELAY_S = 0.25
+
+# Fällige Termine, die mehr als so viele Sekunden verpasst wurden, werden übersprungen
+SCHEDULE_MISFIRE_GRACE_S = 180
+# Abgleich der Schedules mit den Tabs
+SCHEDULE_SYNC_INTERVAL_S = 10
+# Maximale Schlafdauer des Timers, damit Uhrzeitsprünge (z. B. NTP nach dem Booten) auffallen
+SCHEDULE_MAX_SLEEP_S = 60
+
+# Tab-Status als Strings, damit _sync_tabs keine Enum-Instanzen pro Eintrag erzeugt
+_ACTIVE_RUN_STATUSES = frozenset({RunStatus.RUNNING.value, RunStatus.STARTING.value})
+_FINISHED_RUN_STATUSES = frozenset({RunStatus.COMPLETED.value, RunStatus.FAILED.value, RunStatus.CANCELLED.value})
+
+# Wochentage der Regel als Bitmaske (Bit 0 = Montag, wie date.weekday())
+_WEEKDAY_INDEX = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+
+def _weekday_mask(weekdays: list) -> int:
+    mask = 0
+    for w in weekdays:
+        index = _WEEKDAY_INDEX.get(str(w).upper())
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
 
 class ScheduleManager:
     def __init__(
@@ -34,10 +63,24 @@ class ScheduleManager:
         self._lock = asyncio.Lock()
         self._tz = datetime.now().astimezone().tzinfo or timezone.utc
         self._schedules: dict[str, dict] = {}
-        # Hinweis: AsyncIOScheduler darf nicht vor dem Start der Eventloop gebunden werden,
-        # sonst hängt er ggf. an einer falschen Loop und führt keine Jobs aus.
-        # Wir erstellen ihn daher erst in start() mit der aktuellen running loop.
-        self._scheduler = None  # type: ignore[assignment]
+        self._save_task: asyncio.Task | None = None
+        # Hält die Reihenfolge der Schreibvorgänge ein, die ohne self._lock im Thread laufen
+        self._write_lock = asyncio.Lock()
+        # Zuletzt geschriebener Inhalt; unveränderte Snapshots werden nicht erneut geschrieben
+        self._last_saved: bytes | None = None
+        # sid -> (Schlüssel aus enabled/Regel/lastRunUtc, nächster Termin)
+        self._next_cache: dict[str, tuple[tuple, datetime]] = {}
+        # sid -> ((Regel, Minute), Termin) für debug(); Termine liegen immer auf vollen Minuten
+        self._debug_cache: dict[str, tuple[tuple, datetime | None]] = {}
+        # Timer: Heap aus (Epoch-Sekunden, sid), dazu der gültige Termin pro sid.
+        # Verschobene oder gelöschte Termine bleiben im Heap und werden beim Entnehmen
+        # übersprungen, wenn sie nicht mehr zu self._due passen.
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+        self._runner_task: asyncio.Task | None = None
+        self._sync_task: asyncio.Task | None = None
+        self._job_tasks: dict[str, asyncio.Task] = {}
         self._sync_job_id = "__schedule_sync__"
         self._load_profile = load_profile
         self._utcnow_iso = utcnow_iso
@@ -49,8 +92,7 @@ class ScheduleManager:
         if not self.file.exists():
             return
         try:
-            with self.file.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
+            raw = orjson.loads(self.file.read_bytes())
         except Exception:
             return
         if isinstance(raw, dict) and isinstance(raw.get("items"), list):
@@ -80,17 +122,48 @@ class ScheduleManager:
                     it["_queuedRun"] = False
                 self._schedules[sid] = it
 
-    async def _save_locked(self) -> None:
+    def _write_file(self, payload: bytes) -> None:
         tmp = self.file.with_suffix(".tmp")
-        data = {"items": list(self._schedules.values())}
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp.write_bytes(payload)
         tmp.replace(self.file)
 
+    async def _save(self) -> None:
+        # Serialisieren unter self._lock (Snapshot), Schreiben danach im Thread, damit die
+        # Eventloop und andere Schedule-Zugriffe nicht auf das Dateisystem warten
+        async with self._write_lock:
+            async with self._lock:
+                payload = orjson.dumps({"items": list(self._schedules.values())}, option=orjson.OPT_INDENT_2)
+            if payload == self._last_saved:
+                return
+            await asyncio.to_thread(self._write_file, payload)
+            self._last_saved = payload
+
+    def _schedule_save(self) -> None:
+        # Aufruf unter self._lock: markiert Änderungen, geschrieben wird einmal nach SCHEDULE_SAVE_DELAY_S
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.get_running_loop().create_task(self._save_later())
+
+    async def _save_later(self) -> None:
+        await asyncio.sleep(SCHEDULE_SAVE_DELAY_S)
+        # Ab hier nicht mehr abbrechbar (siehe _flush_pending_save); spätere Änderungen
+        # planen einen neuen Speichervorgang ein
+        self._save_task = None
+        await self._save()
+
+    async def _flush_pending_save(self) -> None:
+        task, self._save_task = self._save_task, None
+        if task is not None and not task.done():
+            # Die Task wartet noch auf SCHEDULE_SAVE_DELAY_S; ein bereits laufender
+            # Schreibvorgang wird über _write_lock abgewartet
+            task.cancel()
+            await self._save()
+
     async def list(self) -> list[dict]:
-        async with self._lock:
-            items = [self._with_next(self._schedules[sid]) for sid in sorted(self._schedules.keys())]
-        return items
+        # Ohne Lock: alle Zugriffe laufen in der Eventloop und hier gibt es kein await,
+        # Schreiber können den Zustand also nicht mitten in der Schleife ändern
+        now_local = datetime.now(self._tz)
+        # Reihenfolge = Anlage-Reihenfolge (dict), das Dashboard sortiert selbst
+        return [self._with_next(item, now_local) for item in self._schedules.values()]
 
     async def create(self, payload: dict) -> dict:
         profile_id = str(payload.get("profileId") or "").strip()
@@ -130,7 +203,7 @@ class ScheduleManager:
         doc["nextRunUtc"] = self._to_utc_iso(next_dt)
         async with self._lock:
             self._schedules[sid] = doc
-            await self._save_locked()
+            self._schedule_save()
         self._configure_job(sid, next_dt)
         return dict(doc)
 
@@ -166,7 +239,7 @@ class ScheduleManager:
         updated["nextRunUtc"] = self._to_utc_iso(next_dt)
         async with self._lock:
             self._schedules[sid] = updated
-            await self._save_locked()
+            self._schedule_save()
         self._configure_job(sid, next_dt)
         return dict(updated)
 
@@ -175,26 +248,21 @@ class ScheduleManager:
             if sid not in self._schedules:
                 raise HTTPException(status_code=404, detail="Eintrag nicht gefunden")
             self._schedules.pop(sid)
-            await self._save_locked()
-        with contextlib.suppress(JobLookupError):
-            self._scheduler.remove_job(self._job_id(sid))
+            self._next_cache.pop(sid, None)
+            self._debug_cache.pop(sid, None)
+            self._schedule_save()
+        self._configure_job(sid, None)
+
+    @property
+    def running(self) -> bool:
+        return self._runner_task is not None and not self._runner_task.done()
 
     def start(self) -> None:
-        # Scheduler mit der aktuell laufenden Eventloop initialisieren
-        if self._scheduler is None:
+        # Timer und Tab-Abgleich in der aktuell laufenden Eventloop starten
+        if not self.running:
             loop = asyncio.get_running_loop()
-            from apscheduler.schedulers.asyncio import AsyncIOScheduler as _AsyncIOScheduler
-            self._scheduler = _AsyncIOScheduler(
-                event_loop=loop,
-                timezone=self._tz,
-                job_defaults={
-                    "coalesce": True,
-                    "max_instances": 1,
-                    "misfire_grace_time": 180,
-                },
-            )
-        if not getattr(self._scheduler, "running", False):
-            self._scheduler.start()
+            self._runner_task = loop.create_task(self._run_timers())
+            self._sync_task = loop.create_task(self._run_sync())
         # Nach dem Start alle bekannten Schedules neu berechnen und als Jobs registrieren
         # Wichtig: im FastAPI-Startup läuft bereits eine Eventloop
         try:
@@ -207,23 +275,32 @@ class ScheduleManager:
             loop.create_task(self._refresh_all_jobs())
 
     async def stop(self) -> None:
-        if self._scheduler is not None and getattr(self._scheduler, "running", False):
-            result = self._scheduler.shutdown(wait=False)
-            if asyncio.iscoroutine(result):
-                await result
-            with contextlib.suppress(Exception):
-                self._scheduler.remove_all_jobs()
-        with contextlib.suppress(JobLookupError):
-            if self._scheduler is not None:
-                self._scheduler.remove_job(self._sync_job_id)
-
-    def _with_next(self, item: dict) -> dict:
+        # Noch ausstehende Änderungen vor dem Beenden speichern
+        with contextlib.suppress(Exception):
+            await self._flush_pending_save()
+        tasks = [t for t in (self._runner_task, self._sync_task) if t is not None]
+        self._runner_task = self._sync_task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        self._heap.clear()
+        self._due.clear()
+
+    def _with_next(self, item: dict, now_local: datetime | None = None) -> dict:
         data = dict(item)
-        data["nextRunUtc"] = self._compute_next(item)
+        if now_local is None:
+            now_local = datetime.now(self._tz)
+        # Gespeicherter Termin wird bei jeder Änderung neu gesetzt und gilt, solange er in der
+        # Zukunft liegt (UTC-Strings fester Breite sind chronologisch vergleichbar)
+        stored = item.get("nextRunUtc")
+        if not stored or stored <= self._to_utc_iso(now_local):
+            data["nextRunUtc"] = self._compute_next(item, now_local)
         return data
 
-    def _compute_next(self, item: dict) -> str | None:
-        next_dt = self._next_run_datetime(item)
+    def _compute_next(self, item: dict, now_local: datetime | None = None) -> str | None:
+        next_dt = self._next_run_datetime(item, now_local)
         return self._to_utc_iso(next_dt) if next_dt else None
 
     def _job_id(self, sid: str) -> str:
@@ -233,60 +310,128 @@ class ScheduleManager:
         async with self._lock:
             updates: dict[str, datetime | None] = {}
             changed = False
+            now_local = datetime.now(self._tz)
             for sid, item in self._schedules.items():
-                next_dt = self._next_run_datetime(item)
+                next_dt = self._next_run_datetime(item, now_local)
                 next_str = self._to_utc_iso(next_dt) if next_dt else None
                 if item.get("nextRunUtc") != next_str:
                     item["nextRunUtc"] = next_str
                     changed = True
                 updates[sid] = next_dt
             if changed:
-                await self._save_locked()
-        for sid, run_at in updates.items():
-            self._configure_job(sid, run_at)
-        self._ensure_sync_job()
+                self._schedule_save()
+        self._configure_all_jobs(updates)
+
+    def _configure_all_jobs(self, updates: dict[str, datetime | None]) -> None:
+        # Alle Termine in einem Durchgang ersetzen und den Heap einmal neu aufbauen
+        self._due = {sid: run_at.timestamp() for sid, run_at in updates.items() if run_at}
+        self._heap = [(ts, sid) for sid, ts in self._due.items()]
+        heapq.heapify(self._heap)
+        self._wakeup.set()
 
     def _configure_job(self, sid: str, run_at: datetime | None) -> None:
-        job_id = self._job_id(sid)
-        if self._scheduler is None or not getattr(self._scheduler, "running", False):
-            return
-        with contextlib.suppress(JobLookupError):
-            self._scheduler.remove_job(job_id)
         if not run_at:
-            self._ensure_sync_job()
+            # Alter Heap-Eintrag wird beim Entnehmen verworfen
+            self._due.pop(sid, None)
             return
-        if run_at.tzinfo is None:
-            run_at = run_at.replace(tzinfo=self._tz)
-        trigger = DateTrigger(run_date=run_at.astimezone(self._tz))
-        try:
-            self._scheduler.add_job(
-                self._execute_schedule,
-                trigger=trigger,
-                id=job_id,
-                args=[sid],
-                replace_existing=True,
-                max_instances=1,
-                misfire_grace_time=180,
-            )
-        except Exception:
-            pass
-        self._ensure_sync_job()
-
-    def _ensure_sync_job(self) -> None:
-        if self._scheduler is None or not getattr(self._scheduler, "running", False):
+        ts = run_at.timestamp()
+        if self._due.get(sid) == ts:
             return
-        if self._scheduler.get_job(self._sync_job_id) is None:
-            self._scheduler.add_job(
-                self._sync_tabs,
-                trigger="interval",
-                seconds=10,
-                id=self._sync_job_id,
-                coalesce=True,
-                max_instances=1,
-                misfire_grace_time=30,
+        self._due[sid] = ts
+        heapq.heappush(self._heap, (ts, sid))
+        # Timer nur wecken, wenn der neue Termin vor dem bisher nächsten liegt
+        if self._heap[0] == (ts, sid):
+            self._wakeup.set()
+
+    async def _run_timers(self) -> None:
+        while True:
+            self._wakeup.clear()
+            # _configure_all_jobs ersetzt die Liste
+            heap = self._heap
+            now = time.time()
+            while heap and heap[0][0] <= now:
+                ts, sid = heapq.heappop(heap)
+                if self._due.get(sid) != ts:
+                    continue
+                del self._due[sid]
+                if now - ts > SCHEDULE_MISFIRE_GRACE_S:
+                    continue
+                # Höchstens ein laufender Durchgang pro Schedule
+                running = self._job_tasks.get(sid)
+                if running is None or running.done():
+                    task = asyncio.create_task(self._execute_schedule(sid))
+                    self._job_tasks[sid] = task
+                    task.add_done_callback(lambda t, sid=sid: self._job_done(sid, t))
+            delay = SCHEDULE_MAX_SLEEP_S
+            if heap:
+                delay = min(delay, max(0.0, heap[0][0] - now))
+            # Kein wait_for: das verschluckt unter 3.11 ein cancel(), wenn das Event im
+            # selben Moment gesetzt wird, und stop() würde dann ewig warten
+            with contextlib.suppress(asyncio.TimeoutError):
+                async with async_timeout(delay):
+                    await self._wakeup.wait()
+
+    def _job_done(self, sid: str, task: asyncio.Task) -> None:
+        if self._job_tasks.get(sid) is task:
+            del self._job_tasks[sid]
+        if not task.cancelled():
+            task.exception()
+
+    async def _run_sync(self) -> None:
+        while True:
+            await asyncio.sleep(SCHEDULE_SYNC_INTERVAL_S)
+            try:
+                await self._sync_tabs()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def jobs(self) -> list[dict]:
+        """Geplante Timer für /schedules/jobs, nach Fälligkeit sortiert."""
+        jobs: list[dict] = []
+        for sid, ts in sorted(self._due.items(), key=lambda entry: entry[1]):
+            run_at_iso = datetime.fromtimestamp(ts, self._tz).isoformat()
+            jobs.append(
+                {
+                    "id": self._job_id(sid),
+                    "name": "_execute_schedule",
+                    "next_run_time": run_at_iso,
+                    "trigger": f"date[{run_at_iso}]",
+                }
             )
+        if self.running:
+            jobs.append(
+                {
+                    "id": self._sync_job_id,
+                    "name": "_sync_tabs",
+                    "next_run_time": None,
+                    "trigger": f"interval[{timedelta(seconds=SCHEDULE_SYNC_INTERVAL_S)}]",
+                }
+            )
+        return jobs
+
+    def _next_run_datetime(self, item: dict, now_local: datetime | None = None) -> datetime | None:
+        # Ein berechneter Termin bleibt gültig, solange er in der Zukunft liegt und sich
+        # Regel, enabled und lastRunUtc nicht geändert haben
+        sid = item.get("id")
+        key = (
+            bool(item.get("enabled", True)),
+            orjson.dumps(item.get("rule"), option=orjson.OPT_SORT_KEYS),
+            item.get("lastRunUtc"),
+        )
+        if now_local is None:
+            now_local = datetime.now(self._tz)
+        cached = self._next_cache.get(sid) if sid else None
+        if cached is not None and cached[0] == key and cached[1] > now_local:
+            return cached[1]
+        next_dt = self._calculate_next_run(item, now_local)
+        if sid:
+            if next_dt is not None:
+                self._next_cache[sid] = (key, next_dt)
+            else:
+                self._next_cache.pop(sid, None)
+        return next_dt
 
-    def _next_run_datetime(self, item: dict) -> datetime | None:
+    def _calculate_next_run(self, item: dict, now_local: datetime) -> datetime | None:
         if not item.get("enabled", True):
             return None
         rule = item.get("rule") or {}
@@ -294,19 +439,18 @@ class ScheduleManager:
             rule_type = ScheduleType(rule.get("type"))
         except Exception:
             return None
-        tz = self._tz
-        now_local = datetime.now(self._tz)
-        last_run = self._parse_utc(item.get("lastRunUtc"))
-        last_run = last_run.astimezone(self._tz) if last_run else None
-        exclude_dates = set((rule.get("excludeDates") or []) if isinstance(rule.get("excludeDates"), list) else [])
         if rule_type == ScheduleType.ONCE:
             dt = self._get_once_dt(rule)
             if dt:
-                if last_run and last_run >= dt:
+                # lastRunUtc direkt als UTC-String fester Breite vergleichen statt ihn zu
+                # parsen und umzurechnen (nur einmalige Regeln brauchen den letzten Lauf)
+                last_run = item.get("lastRunUtc")
+                if isinstance(last_run, str) and len(last_run) == 16 and last_run >= self._to_utc_iso(dt):
                     return None
                 if dt > now_local:
                     return dt
             return None
+        exclude_dates = self._exclude_ordinals(rule)
         if rule_type == ScheduleType.DAILY:
             interval_days = max(1, int(rule.get("interval") or 1))
             start_date = rule.get("startDate")
@@ -325,6 +469,20 @@ class ScheduleManager:
         return None
 
 
+    def _exclude_ordinals(self, rule: dict) -> frozenset[int]:
+        # excludeDates ("YYYY-MM-DD") einmal als Tagesnummern, damit die Tagesschleifen
+        # keinen String pro Tag bauen müssen; ungültige Einträge werden ignoriert
+        raw = rule.get("excludeDates")
+        if not isinstance(raw, list) or not raw:
+            return frozenset()
+        ordinals = set()
+        for value in raw:
+            try:
+                ordinals.add(date.fromisoformat(value).toordinal())
+            except (TypeError, ValueError):
+                continue
+        return frozenset(ordinals)
+
     def _get_once_dt(self, rule: dict) -> datetime | None:
         return self._local_datetime(rule.get("date"), rule.get("time"), self._tz)
 
@@ -336,7 +494,7 @@ class ScheduleManager:
         end_date: str | None,
         time_str: str | None,
         tz: timezone,
-        exclude_dates: set[str],
+        exclude_dates: frozenset[int],
     ) -> datetime | None:
         if not time_str:
             return None
@@ -348,28 +506,20 @@ class ScheduleManager:
         end_dt = self._local_datetime(end_date, "23:59", tz) if end_date else None
         after_local = after.astimezone(tz)
         anchor_date = start_dt.date() if start_dt else after_local.date()
-        cursor = after_local.replace(hour=0, minute=0, second=0, microsecond=0)
-        for _ in range(0, 732):
-            day = cursor.date()
-            if start_dt and day < start_dt.date():
-                cursor += timedelta(days=1)
-                continue
+        interval = max(1, interval_days)
+        # Gesucht wird in den nächsten 732 Tagen; direkt zum ersten Tag im Intervallraster springen
+        last_day = after_local.date() + timedelta(days=731)
+        first_day = max(after_local.date(), anchor_date)
+        day = first_day + timedelta(days=-(first_day - anchor_date).days % interval)
+        step = timedelta(days=interval)
+        while day <= last_day:
             if end_dt and day > end_dt.date():
                 return None
-            if day.isoformat() in exclude_dates:
-                cursor += timedelta(days=1)
-                continue
-            candidate = cursor.replace(hour=hh, minute=mm, second=0, microsecond=0)
-            if candidate <= after_local:
-                cursor += timedelta(days=1)
-                continue
-            delta_days = (day - anchor_date).days
-            if delta_days < 0:
-                cursor += timedelta(days=1)
-                continue
-            if (delta_days % max(1, interval_days)) == 0:
-                return candidate
-            cursor += timedelta(days=1)
+            if day.toordinal() not in exclude_dates:
+                candidate = after_local.replace(year=day.year, month=day.month, day=day.day, hour=hh, minute=mm, second=0, microsecond=0)
+                if candidate > after_local:
+                    return candidate
+            day += step
         return None
 
     def _most_recent_weekly_occurrence(
@@ -381,11 +531,10 @@ class ScheduleManager:
         end_date: str | None,
         time_str: str | None,
         tz: timezone,
-        exclude_dates: set[str],
+        exclude_dates: frozenset[int],
     ) -> datetime | None:
-        map_wd = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
-        selected = sorted({map_wd.get(str(w).upper(), -1) for w in weekdays if map_wd.get(str(w).upper(), -1) >= 0})
-        if not selected or not time_str:
+        weekday_mask = _weekday_mask(weekdays)
+        if not weekday_mask or not time_str:
             return None
         try:
             hh, mm = [int(x) for x in time_str.split(":")]
@@ -403,9 +552,9 @@ class ScheduleManager:
                 break
             if end_dt and candidate > end_dt:
                 continue
-            if candidate.date().isoformat() in exclude_dates:
+            if candidate.toordinal() in exclude_dates:
                 continue
-            if candidate.weekday() not in selected:
+            if not (weekday_mask >> candidate.weekday()) & 1:
                 continue
             if anchor_date is not None:
                 delta_days = (candidate.date() - anchor_date).days
@@ -421,11 +570,12 @@ class ScheduleManager:
     def _parse_utc(self, s: str | None) -> datetime | None:
         if not s:
             return None
-        m = re.match(r"^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z$", s)
-        if not m:
+        # Festes Format YYYYMMDDTHHMMSSZ: per Slicing statt Regex zerlegen
+        if len(s) != 16 or s[8] != "T" or s[15] != "Z" or not (s[:8].isdecimal() and s[9:15].isdecimal()):
             return None
-        y, mo, d, h, mi, sec = map(int, m.groups())
-        dt_utc = datetime(y, mo, d, h, mi, sec, tzinfo=timezone.utc)
+        dt_utc = datetime(
+            int(s[0:4]), int(s[4:6]), int(s[6:8]), int(s[9:11]), int(s[11:13]), int(s[13:15]), tzinfo=timezone.utc
+        )
         return dt_utc.astimezone(self._tz)
 
     def _is_same_day(self, dt1: datetime | None, dt2: datetime | None) -> bool:
@@ -446,8 +596,9 @@ class ScheduleManager:
     def _to_utc_iso(self, dt_local: datetime) -> str:
         if dt_local.tzinfo is None:
             dt_local = dt_local.replace(tzinfo=self._tz)
-        dt_utc = dt_local.astimezone(timezone.utc)
-        return dt_utc.strftime("%Y%m%dT%H%M%SZ")
+        u = dt_local.astimezone(timezone.utc)
+        # Direkte Formatierung ist deutlich schneller als strftime (pro Schedule und Tick aufgerufen)
+        return f"{u.year:04d}{u.month:02d}{u.day:02d}T{u.hour:02d}{u.minute:02d}{u.second:02d}Z"
 
     def _next_weekly_occurrence(
         self,
@@ -458,11 +609,10 @@ class ScheduleManager:
         end_date: str | None,
         time_str: str | None,
         tz: timezone,
-        exclude_dates: set[str],
+        exclude_dates: frozenset[int],
     ) -> datetime | None:
-        map_wd = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
-        selected = sorted({map_wd.get(str(w).upper(), -1) for w in weekdays if map_wd.get(str(w).upper(), -1) >= 0})
-        if not selected or not time_str:
+        weekday_mask = _weekday_mask(weekdays)
+        if not weekday_mask or not time_str:
             return None
         try:
             hh, mm = [int(x) for x in time_str.split(":")]
@@ -473,36 +623,32 @@ class ScheduleManager:
         end_dt = self._local_datetime(end_date, "23:59", tz) if end_date else None
         after_local = after.astimezone(tz)
         anchor_date = start_dt.date() if start_dt else after_local.date()
-        cursor = after_local.replace(hour=0, minute=0, second=0, microsecond=0)
-        for _ in range(0, 366):
-            day = cursor.date()
-            if start_dt and day < start_dt.date():
-                cursor += timedelta(days=1)
-                continue
-            if end_dt and day > end_dt.date():
-                return None
-            if day.isoformat() in exclude_dates:
-                cursor += timedelta(days=1)
-                continue
-            if cursor.weekday() not in selected:
-                cursor += timedelta(days=1)
-                continue
-            candidate = cursor.replace(hour=hh, minute=mm, second=0, microsecond=0)
-            if candidate <= after_local:
-                cursor += timedelta(days=1)
-                continue
-            delta_days = (day - anchor_date).days
-            if delta_days < 0:
-                cursor += timedelta(days=1)
-                continue
-            weeks = delta_days // 7
-            if weeks % interval == 0:
-                return candidate
-            cursor += timedelta(days=1)
-        return None
+        # Wochen zählen in 7-Tage-Blöcken ab anchor_date; nur jeder interval-te Block ist aktiv.
+        # Gesucht wird in den nächsten 366 Tagen, inaktive Blöcke werden übersprungen.
+        first_day = max(after_local.date(), anchor_date)
+        last_day = after_local.date() + timedelta(days=365)
+        week = (first_day - anchor_date).days // 7
+        week += -week % interval
+        while True:
+            block_start = anchor_date + timedelta(days=7 * week)
+            for offset in range(7):
+                day = block_start + timedelta(days=offset)
+                if day < first_day:
+                    continue
+                if day > last_day:
+                    return None
+                if end_dt and day > end_dt.date():
+                    return None
+                if not (weekday_mask >> day.weekday()) & 1 or day.toordinal() in exclude_dates:
+                    continue
+                candidate = after_local.replace(year=day.year, month=day.month, day=day.day, hour=hh, minute=mm, second=0, microsecond=0)
+                if candidate > after_local:
+                    return candidate
+            week += interval
 
     async def _execute_schedule(self, schedule_id: str, force: bool = False) -> None:
-        schedule_copy: dict | None = None
+        # Nur die Felder, die _start_scheduled_run braucht, statt einer Kopie des Eintrags
+        run_args: tuple[str, str | None, str | None] | None = None
         next_dt: datetime | None = None
         schedule_enabled = True
         async with self._lock:
@@ -513,33 +659,40 @@ class ScheduleManager:
             if not schedule_enabled and not force:
                 return
             if item.get("currentTabId"):
+                changed = False
                 if not force:
-                    if not bool(item.get("skipIfRunning", True)):
+                    if not bool(item.get("skipIfRunning", True)) and item.get("_queuedRun") is not True:
                         item["_queuedRun"] = True
+                        changed = True
                 next_dt = self._next_run_datetime(item) if schedule_enabled else None
-                item["nextRunUtc"] = self._to_utc_iso(next_dt) if next_dt else None
-                await self._save_locked()
+                next_str = self._to_utc_iso(next_dt) if next_dt else None
+                if item.get("nextRunUtc") != next_str:
+                    item["nextRunUtc"] = next_str
+                    changed = True
+                # Nur speichern, wenn sich wirklich etwas geändert hat
+                if changed:
+                    self._schedule_save()
             else:
                 now_utc = datetime.now(timezone.utc)
-                item["lastRunUtc"] = now_utc.strftime("%Y%m%dT%H%M%SZ")
+                item["lastRunUtc"] = self._to_utc_iso(now_utc)
                 item["lastRunStatus"] = None
                 item["updatedUtc"] = item["lastRunUtc"]
-                item["inProgressUntilUtc"] = (now_utc + timedelta(minutes=3)).strftime("%Y%m%dT%H%M%SZ")
-                schedule_copy = dict(item)
+                item["inProgressUntilUtc"] = self._to_utc_iso(now_utc + timedelta(minutes=3))
+                run_args = (schedule_id, item.get("profileId"), item.get("title"))
                 if schedule_enabled:
                     next_dt = self._next_run_datetime(item)
                 else:
                     next_dt = None
                 item["nextRunUtc"] = self._to_utc_iso(next_dt) if next_dt else None
-                await self._save_locked()
+                self._schedule_save()
         if schedule_enabled:
             self._configure_job(schedule_id, next_dt)
         else:
             self._configure_job(schedule_id, None)
-        if schedule_copy is None:
+        if run_args is None:
             return
         try:
-            await self._start_scheduled_run(schedule_copy)
+            await self._start_scheduled_run(*run_args)
         except Exception:  # noqa: BLE001
             pass
             async with self._lock:
@@ -548,7 +701,7 @@ class ScheduleManager:
                     stored["inProgressUntilUtc"] = None
                     stored["lastRunStatus"] = RunStatus.FAILED.value
                     stored["updatedUtc"] = self._utcnow_iso()
-                    await self._save_locked()
+                    self._schedule_save()
 
     async def _sync_tabs(self) -> None:
         try:
@@ -558,6 +711,8 @@ class ScheduleManager:
             tabs_by_id = {}
         changed = False
         async with self._lock:
+            # Ein Zeitstempel pro Durchlauf für lastRunUtc und updatedUtc (gleiches Format)
+            now_utc = self._utcnow_iso()
             for sid, item in list(self._schedules.items()):
                 tab_id = item.get("currentTabId")
                 if not tab_id:
@@ -569,11 +724,8 @@ class ScheduleManager:
                     continue
                 tab = tabs_by_id.get(str(tab_id)) or {}
                 status = tab.get("status")
-                try:
-                    status_enum = RunStatus(status) if status is not None else None
-                except Exception:
-                    status_enum = None
-                if status_enum not in {RunStatus.RUNNING, RunStatus.STARTING}:
+                status_value = status if isinstance(status, str) else None
+                if status_value not in _ACTIVE_RUN_STATUSES:
                     run = tab.get("run") if isinstance(tab.get("run"), dict) else None
                     capture_id = run.get("capture_id") if run else None
                     if capture_id:
@@ -583,22 +735,21 @@ class ScheduleManager:
                             item["lastCaptureId"] = f"pid-{int(run.get('pid'))}"
                         except Exception:
                             pass
-                    if status_enum in {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELLED}:
+                    if status_value in _FINISHED_RUN_STATUSES:
                         item["lastRunStatus"] = status
-                    now_utc = datetime.now(timezone.utc)
-                    item["lastRunUtc"] = now_utc.strftime("%Y%m%dT%H%M%SZ")
+                    item["lastRunUtc"] = now_utc
                     item["currentTabId"] = None
                     item["currentTabStatus"] = None
                     item["inProgressUntilUtc"] = None
-                    item["updatedUtc"] = self._utcnow_iso()
+                    item["updatedUtc"] = now_utc
                     changed = True
                 else:
                     if item.get("currentTabStatus") != status:
                         item["currentTabStatus"] = status
-                        item["updatedUtc"] = self._utcnow_iso()
+                        item["updatedUtc"] = now_utc
                         changed = True
             if changed:
-                await self._save_locked()
+                self._schedule_save()
 
     async def trigger(self, schedule_id: str) -> tuple[bool, str]:
         async with self._lock:
@@ -611,18 +762,21 @@ class ScheduleManager:
         return True, "Schedule wurde manuell gestartet"
 
     async def debug(self, window_before: int = 15, window_after: int = 60) -> dict:
-        async with self._lock:
-            items = [dict(item) for item in self._schedules.values()]
-        now_local_default = datetime.now(self._tz)
+        # Snapshot ohne Lock (siehe list())
+        items = [dict(item) for item in self._schedules.values()]
+        # Zeitzone und Zeitpunkt einmal für alle Einträge
+        tz = self._tz
+        now_local = datetime.now(tz)
+        now_iso = now_local.isoformat()
         schedules: list[dict] = []
         for item in items:
-            now_local = datetime.now(self._tz)
             rule = item.get("rule", {})
             try:
                 rule_type = ScheduleType(rule.get("type"))
             except Exception:
                 rule_type = None
             last_run = self._parse_utc(item.get("lastRunUtc"))
+            last_run_iso = last_run.isoformat() if last_run else None
             inprog = self._parse_utc(item.get("inProgressUntilUtc"))
             eligible = False
             reason = "unknown"
@@ -637,7 +791,7 @@ class ScheduleManager:
                     dt_local = self._get_once_dt(rule)
                     if dt_local:
                         if last_run and last_run >= dt_local:
-                            reason = f"already ran at {last_run.isoformat()}"
+                            reason = f"already ran at {last_run_iso}"
                         else:
                             delta = (now_local - dt_local).total_seconds()
                             if -window_before <= delta <= window_after:
@@ -651,18 +805,10 @@ class ScheduleManager:
                     else:
                         reason = "invalid date/time"
                 elif rule_type == ScheduleType.DAILY:
-                    occ = self._next_daily_occurrence(
-                        now_local,
-                        max(1, int(rule.get("interval") or 1)),
-                        rule.get("startDate"),
-                        rule.get("endDate"),
-                        rule.get("time"),
-                        self._tz,
-                        set((rule.get("excludeDates") or []) if isinstance(rule.get("excludeDates"), list) else []),
-                    )
+                    occ = self._debug_occurrence(item.get("id"), rule_type, rule, now_local, tz)
                     if occ:
                         if last_run and self._is_same_day(last_run, occ):
-                            reason = f"already ran today at {last_run.isoformat()}"
+                            reason = f"already ran today at {last_run_iso}"
                         else:
                             delta = (now_local - occ).total_seconds()
                             if -window_before <= delta <= window_after:
@@ -676,19 +822,10 @@ class ScheduleManager:
                     else:
                         reason = "no valid occurrence found"
                 elif rule_type == ScheduleType.WEEKLY:
-                    occ = self._most_recent_weekly_occurrence(
-                        now_local,
-                        rule.get("weekdays") or [],
-                        int(rule.get("interval") or 1),
-                        rule.get("startDate"),
-                        rule.get("endDate"),
-                        rule.get("time"),
-                        self._tz,
-                        set((rule.get("excludeDates") or []) if isinstance(rule.get("excludeDates"), list) else []),
-                    )
+                    occ = self._debug_occurrence(item.get("id"), rule_type, rule, now_local, tz)
                     if occ:
                         if last_run and self._is_same_day(last_run, occ):
-                            reason = f"already ran today at {last_run.isoformat()}"
+                            reason = f"already ran today at {last_run_iso}"
                         else:
                             delta = (now_local - occ).total_seconds()
                             if -window_before <= delta <= window_after:
@@ -711,42 +848,74 @@ class ScheduleManager:
                     "enabled": item.get("enabled", True),
                     "rule": rule,
                     "lastRunUtc": item.get("lastRunUtc"),
-                    "lastRunLocal": last_run.isoformat() if last_run else None,
+                    "lastRunLocal": last_run_iso,
                     "inProgressUntilUtc": item.get("inProgressUntilUtc"),
                     "currentTabId": item.get("currentTabId"),
                     "currentTabStatus": item.get("currentTabStatus"),
                     "nextRunUtc": item.get("nextRunUtc"),
                     "eligible": eligible,
                     "reason": reason,
-                    "nowLocal": now_local.isoformat(),
+                    "nowLocal": now_iso,
                 }
             )
-        return {"now": now_local_default.isoformat(), "schedules": schedules}
+        return {"now": now_iso, "schedules": schedules}
 
-    async def _start_scheduled_run(self, item: dict) -> None:
+    def _debug_occurrence(
+        self, sid: str | None, rule_type: ScheduleType, rule: dict, now_local: datetime, tz: timezone
+    ) -> datetime | None:
+        # Termine liegen auf vollen Minuten, innerhalb derselben Minute bleibt das Ergebnis
+        # gleich; wiederholte Aufrufe (Polling der Debug-Ansicht) nutzen es weiter
+        key = (orjson.dumps(rule, option=orjson.OPT_SORT_KEYS), int(now_local.timestamp() // 60))
+        cached = self._debug_cache.get(sid) if sid else None
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if rule_type == ScheduleType.DAILY:
+            occ = self._next_daily_occurrence(
+                now_local,
+                max(1, int(rule.get("interval") or 1)),
+                rule.get("startDate"),
+                rule.get("endDate"),
+                rule.get("time"),
+                tz,
+                self._exclude_ordinals(rule),
+            )
+        else:
+            occ = self._most_recent_weekly_occurrence(
+                now_local,
+                rule.get("weekdays") or [],
+                int(rule.get("interval") or 1),
+                rule.get("startDate"),
+                rule.get("endDate"),
+                rule.get("time"),
+                tz,
+                self._exclude_ordinals(rule),
+            )
+        if sid:
+            self._debug_cache[sid] = (key, occ)
+        return occ
+
+    async def _start_scheduled_run(self, sid: str, profile_id: str | None, title: str | None) -> None:
         try:
-            profile = self._load_profile(item.get("profileId"))
-            title = item.get("title") or f"Plan: {profile.get('name') or 'Test'}"
+            profile = self._load_profile(profile_id)
+            title = title or f"Plan: {profile.get('name') or 'Test'}"
             tab = await self.tests_manager.create_tab(title=title, profile_id=profile.get("id"))
             started = await self.tests_manager.start_test(tab.get("id"), profile)
             async with self._lock:
-                sid = str(item.get("id"))
                 stored = self._schedules.get(sid)
                 if stored:
                     stored["currentTabId"] = tab.get("id")
                     stored["currentTabStatus"] = (started.get("status") if isinstance(started, dict) else "running")
                     stored["inProgressUntilUtc"] = None
                     stored["updatedUtc"] = self._utcnow_iso()
-                    await self._save_locked()
+                    self._schedule_save()
         except Exception:
             try:
                 async with self._lock:
-                    sid = str(item.get("id"))
                     stored = self._schedules.get(sid)
                     if stored:
                         stored["inProgressUntilUtc"] = None
                         stored["updatedUtc"] = self._utcnow_iso()
-                        await self._save_locked()
+                        self._schedule_save()
             except Exception:
                 pass
 
@@ -759,12 +928,12 @@ def create_scheduling_router(schedule_manager: ScheduleManager) -> APIRouter:
         return await schedule_manager.list()
 
     @router.post("/schedules")
-    async def api_create_schedule(payload: dict = Body()):  # type: ignore[type-arg]
-        return await schedule_manager.create(payload)
+    async def api_create_schedule(payload: UpsertSchedulePayload):
+        return await schedule_manager.create(payload.model_dump(exclude_unset=True))
 
     @router.put("/schedules/{schedule_id}")
-    async def api_update_schedule(schedule_id: str, payload: dict = Body()):  # type: ignore[type-arg]
-        return await schedule_manager.update(schedule_id, payload)
+    async def api_update_schedule(schedule_id: str, payload: UpsertSchedulePayload):
+        return await schedule_manager.update(schedule_id, payload.model_dump(exclude_unset=True))
 
     @router.delete("/schedules/{schedule_id}")
     async def api_delete_schedule(schedule_id: str):
@@ -773,22 +942,15 @@ def create_scheduling_router(schedule_manager: ScheduleManager) -> APIRouter:
 
     @router.get("/schedules/debug")
     async def api_debug_schedules():
-        return await schedule_manager.debug()
+        # Zeilen sind bereits JSON-taugliche dicts: direkt mit orjson serialisieren, ohne
+        # dass jsonable_encoder jede Zeile erneut durchläuft
+        return Response(content=orjson.dumps(await schedule_manager.debug()), media_type="application/json")
 
     @router.get("/schedules/jobs")
     async def api_list_scheduler_jobs():
-        jobs = schedule_manager._scheduler.get_jobs()
         return {
-            "scheduler_running": schedule_manager._scheduler.running,
-            "jobs": [
-                {
-                    "id": job.id,
-                    "name": job.name,
-                    "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-                    "trigger": str(job.trigger),
-                }
-                for job in jobs
-            ],
+            "scheduler_running": schedule_manager.running,
+            "jobs": schedule_manager.jobs(),
         }
 
     @router.post("/schedules/{schedule_id}/trigger")
@@ -96,6 +96,18 @@ class CreateSshUserPayload(BaseModel):
 	username: str
 
 
+class UpsertSchedulePayload(BaseModel):
+	"""
+	Body for creating and updating schedules. Fields that are not sent stay unset,
+	so updates keep the current values; the rule itself is checked by the ScheduleManager.
+	"""
+	profileId: Optional[str] = None
+	title: Optional[str] = None
+	enabled: Optional[bool] = None
+	skipIfRunning: Optional[bool] = None
+	rule: Optional[Dict[str, Any]] = None
+
+
 class UpdateCaptureSessionPayload(BaseModel):
 	test_name: str
 
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-import json
+import bisect
+import logging
 import re
 from pathlib import Path
 
+import orjson
 from fastapi import HTTPException
 
 from services.api.deps import PROFILES_DIR
+from services.api.utils.debounce import DebouncedFlush
 
 
+logger = logging.getLogger(__name__)
+
 SSH_USERS_FILE = PROFILES_DIR / "ssh_users.json"
 
+# Users are read from disk once and kept sorted (case-insensitive) in memory;
+# changes are written after USERS_WRITE_DELAY_S so bulk changes share one write
+USERS_WRITE_DELAY_S = 1.0
+_users_sorted: list[str] | None = None
+_users_set: set[str] = set()
+_users_dirty = False
+
 
 def ensure_profiles_and_users_file() -> None:
     try:
@@ -19,50 +31,112 @@ def ensure_profiles_and_users_file() -> None:
         raise HTTPException(status_code=500, detail=f"Profile-Verzeichnis kann nicht erstellt werden: {exc}")
     if not SSH_USERS_FILE.exists():
         try:
-            with SSH_USERS_FILE.open("w", encoding="utf-8") as f:
-                json.dump({"users": []}, f, ensure_ascii=False, indent=2)
+            SSH_USERS_FILE.write_bytes(orjson.dumps({"users": []}, option=orjson.OPT_INDENT_2))
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=500, detail=f"Nutzerdatei konnte nicht erstellt werden: {exc}")
 
 
+_UNSAFE_USERNAME_CHARS = re.compile(r"[^a-zA-Z0-9_.-]")
+_LEADING_USERNAME_PUNCT = re.compile(r"^[._-]+")
+
+
 def sanitize_username(name: str) -> str:
     name2 = str(name or "").strip()
-    name2 = re.sub(r"[^a-zA-Z0-9_.-]", "_", name2)
-    name2 = re.sub(r"^[._-]+", "", name2)
+    name2 = _UNSAFE_USERNAME_CHARS.sub("_", name2)
+    name2 = _LEADING_USERNAME_PUNCT.sub("", name2)
     return name2
 
 
-def load_users() -> list[str]:
+def _read_users_file() -> list[str]:
     ensure_profiles_and_users_file()
     try:
-        with SSH_USERS_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            users = data.get("users")
-            if isinstance(users, list):
-                cleaned: list[str] = []
-                seen = set()
-                for u in users:
-                    if not isinstance(u, str):
-                        continue
-                    name = sanitize_username(u)
-                    if not name or name in seen:
-                        continue
-                    seen.add(name)
-                    cleaned.append(name)
-                return sorted(cleaned, key=lambda x: x.lower())
-            return []
+        data = orjson.loads(SSH_USERS_FILE.read_bytes())
+        users = data.get("users")
+        if isinstance(users, list):
+            cleaned: list[str] = []
+            seen = set()
+            for u in users:
+                if not isinstance(u, str):
+                    continue
+                name = sanitize_username(u)
+                if not name or name in seen:
+                    continue
+                seen.add(name)
+                cleaned.append(name)
+            cleaned.sort(key=str.lower)
+            return cleaned
+        return []
     except FileNotFoundError:
         return []
     except Exception:  # noqa: BLE001
         return []
 
 
-def save_users(users: list[str]) -> None:
+def _cached_users() -> list[str]:
+    global _users_sorted, _users_set
+    if _users_sorted is None:
+        _users_sorted = _read_users_file()
+        _users_set = set(_users_sorted)
+    return _users_sorted
+
+
+def load_users() -> list[str]:
+    return list(_cached_users())
+
+
+def add_user(username: str) -> bool:
+    """Add a user (sorted insert) and queue the write. Returns False if it already exists."""
+    users = _cached_users()
+    if username in _users_set:
+        return False
+    bisect.insort_left(users, username, key=str.lower)
+    _users_set.add(username)
+    _queue_users_write()
+    return True
+
+
+def remove_user(username: str) -> bool:
+    """Remove a user and queue the write. Returns False if it does not exist."""
+    users = _cached_users()
+    if username not in _users_set:
+        return False
+    users.remove(username)
+    _users_set.discard(username)
+    _queue_users_write()
+    return True
+
+
+def _write_users_file(users: list[str]) -> None:
     ensure_profiles_and_users_file()
     try:
-        with SSH_USERS_FILE.open("w", encoding="utf-8") as f:
-            json.dump({"users": users}, f, ensure_ascii=False, indent=2)
+        SSH_USERS_FILE.write_bytes(orjson.dumps({"users": users}, option=orjson.OPT_INDENT_2))
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"Nutzerdatei konnte nicht gespeichert werden: {exc}")
 
 
+def _queue_users_write() -> None:
+    """Mark the user list as changed; must be called from the running event loop."""
+    global _users_dirty
+    _users_dirty = True
+    _users_flush.schedule()
+
+
+def flush_pending_users() -> None:
+    """Write the user list if it changed since the last write (also called on shutdown)."""
+    _users_flush.flush()
+
+
+def _write_pending_users() -> None:
+    global _users_dirty
+    if not _users_dirty or _users_sorted is None:
+        return
+    _users_dirty = False
+    users = list(_users_sorted)
+    try:
+        _write_users_file(users)
+    except HTTPException as exc:
+        _users_dirty = True
+        logger.error("SSH-Nutzerliste konnte nicht gespeichert werden: %s", exc.detail)
+
+
+_users_flush = DebouncedFlush(USERS_WRITE_DELAY_S, _write_pending_users)
@@ -0,0 +1,68 @@
+"""Debounced profile and SSH user writes must not lose changes made while a flush is writing."""
+
+import asyncio
+import threading
+import time
+
+import orjson
+
+from services.api import profile_service, ssh_service
+
+
+def test_profile_update_during_slow_flush_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_service, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(profile_service._profile_flush, "delay_s", 0.05)
+    monkeypatch.setattr(profile_service, "_pending_profiles", {})
+
+    write_started = threading.Event()
+    original_write = profile_service._write_profile_file
+
+    def slow_write(path, payload):
+        write_started.set()
+        time.sleep(0.2)
+        original_write(path, payload)
+
+    monkeypatch.setattr(profile_service, "_write_profile_file", slow_write)
+
+    async def scenario():
+        profile_service.queue_profile_write("p", {"v": 1})
+        # Second update while the first flush is inside the threaded write
+        await asyncio.to_thread(write_started.wait, 2)
+        profile_service.queue_profile_write("p", {"v": 2})
+        await asyncio.sleep(0.6)
+
+    asyncio.run(scenario())
+
+    assert profile_service._pending_profiles == {}
+    assert orjson.loads(profile_service.profile_path("p").read_bytes()) == {"v": 2}
+
+
+def test_ssh_user_added_during_slow_flush_is_written(tmp_path, monkeypatch):
+    users_file = tmp_path / "ssh_users.json"
+    users_file.write_bytes(orjson.dumps({"users": []}))
+    monkeypatch.setattr(ssh_service, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(ssh_service, "SSH_USERS_FILE", users_file)
+    monkeypatch.setattr(ssh_service._users_flush, "delay_s", 0.05)
+    monkeypatch.setattr(ssh_service, "_users_sorted", None)
+    monkeypatch.setattr(ssh_service, "_users_dirty", False)
+
+    write_started = threading.Event()
+    original_write = ssh_service._write_users_file
+
+    def slow_write(users):
+        write_started.set()
+        time.sleep(0.2)
+        original_write(users)
+
+    monkeypatch.setattr(ssh_service, "_write_users_file", slow_write)
+
+    async def scenario():
+        ssh_service.add_user("alice")
+        await asyncio.to_thread(write_started.wait, 2)
+        ssh_service.add_user("bob")
+        await asyncio.sleep(0.6)
+
+    asyncio.run(scenario())
+
+    assert ssh_service._users_dirty is False
+    assert orjson.loads(users_file.read_bytes()) == {"users": ["alice", "bob"]}
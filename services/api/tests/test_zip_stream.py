@@ -0,0 +1,60 @@
+"""Streamed ZIP downloads must stay valid when capture files vanish after listing."""
+
+import asyncio
+import io
+import zipfile
+
+import anyio
+import pytest
+from fastapi import HTTPException
+
+from services.api.utils.file_operations import create_zip_response, iter_zip_stream
+
+
+def _make_files(tmp_path):
+    files = []
+    for name, size in (("cap.pcap0", 3 * 1024 * 1024 + 17), ("cap.pcap1", 1000), ("cap_summary.csv", 10)):
+        path = tmp_path / name
+        path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+        files.append(path)
+    return files
+
+
+def test_file_deleted_after_listing_is_skipped(tmp_path):
+    files = _make_files(tmp_path)
+    entries = [(path, f"session/{path.name}") for path in files]
+    # Ring buffer rotation removes a file between listing and streaming
+    files[1].unlink()
+
+    data = b"".join(iter_zip_stream(entries))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["session/cap.pcap0", "session/cap_summary.csv"]
+        assert zf.read("session/cap.pcap0") == files[0].read_bytes()
+
+
+def test_streaming_response_runs_under_limiter(tmp_path):
+    files = _make_files(tmp_path)
+
+    async def download():
+        limiter = anyio.CapacityLimiter(1)
+        response = create_zip_response(files, "x.zip", limiter=limiter)
+        files[2].unlink()
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    data = asyncio.run(download())
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["cap.pcap0", "cap.pcap1"]
+
+
+def test_all_files_gone_is_a_clean_error(tmp_path):
+    files = _make_files(tmp_path)
+    for path in files:
+        path.unlink()
+
+    with pytest.raises(HTTPException) as exc_info:
+        create_zip_response(files, "x.zip")
+    assert exc_info.value.status_code == 404
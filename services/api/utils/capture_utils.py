@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -10,16 +11,18 @@ from fastapi import HTTPException
 from services.api.enums import ErrorMessages, FileType
 
 
-def list_capture_files(start_row: dict) -> list[Path]:
+def list_capture_entries(start_row: dict) -> list[os.DirEntry]:
     """
-    List all files belonging to a capture session.
-    Finds both .pcap files and related metadata like _summary.csv.
+    List the directory entries of all files belonging to a capture session.
+    
+    A single scandir pass; the entries cache their file type and stat
+    result, so callers that also need sizes avoid extra syscalls.
     
     Args:
         start_row: Start event dictionary from metadata
         
     Returns:
-        List of Path objects for all related files
+        List of os.DirEntry objects sorted by name
     """
     filename_base = start_row.get("filename_base")
     if not filename_base:
@@ -27,19 +30,32 @@ def list_capture_files(start_row: dict) -> list[Path]:
     
     try:
         base_path = Path(filename_base)
-        parent_dir = base_path.parent
-        
-        if not parent_dir.exists():
-            return []
         
         # Use stem (without .pcap extension) to find all related files
         # This matches: .pcap, .pcap00, .pcap01, ... as well as _summary.csv
         stem = base_path.stem
-        return [p for p in sorted(parent_dir.glob(stem + "*")) if p.is_file()]
+        with os.scandir(base_path.parent) as it:
+            entries = [e for e in it if e.name.startswith(stem) and e.is_file()]
+        entries.sort(key=lambda e: e.name)
+        return entries
     except Exception:
         return []
 
 
+def list_capture_files(start_row: dict) -> list[Path]:
+    """
+    List all files belonging to a capture session.
+    Finds both .pcap files and related metadata like _summary.csv.
+    
+    Args:
+        start_row: Start event dictionary from metadata
+        
+    Returns:
+        List of Path objects for all related files
+    """
+    return [Path(e.path) for e in list_capture_entries(start_row)]
+
+
 def get_session_dir_and_base(start_row: dict) -> tuple[Path, str]:
     """
     Get the base directory and file stem for a capture session.
@@ -72,11 +88,13 @@ def is_metadata_file(file_path: Path) -> bool:
     Returns:
         True if the file is a metadata file, False otherwise
     """
-    return file_path.suffix == ".csv" and ("_meta" in file_path.stem or "_summary" in file_path.stem)
+    # Plain string checks on the name; suffix/stem would split the name again each time
+    name = file_path.name
+    return name.endswith(".csv") and ("_meta" in name or "_summary" in name)
 
 
 def categorize_capture_files(
-    files: list[Path],
+    files: list[Path] | list[os.DirEntry],
     interface: str,
     capture_id: str
 ) -> tuple[list[dict], list[dict]]:
@@ -84,7 +102,7 @@ def categorize_capture_files(
     Categorize files into capture files and metadata files.
     
     Args:
-        files: List of file paths
+        files: List of file paths or directory entries (from list_capture_entries)
         interface: Interface name for the capture
         capture_id: Capture ID
         
@@ -94,11 +112,12 @@ def categorize_capture_files(
     all_files: list[dict] = []
     metadata_files: list[dict] = []
     
-    for file_path in files:
+    for entry in files:
         try:
-            size = file_path.stat().st_size
+            size = entry.stat().st_size
         except OSError:
             size = None
+        file_path = Path(entry)
         
         is_meta = is_metadata_file(file_path)
         
@@ -119,6 +138,10 @@ def categorize_capture_files(
     return all_files, metadata_files
 
 
+# Characters that are not allowed in file and folder names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+
 def make_safe_filename(test_name: str) -> str:
     """
     Convert a test name into a safe filename by replacing invalid characters.
@@ -129,4 +152,4 @@ def make_safe_filename(test_name: str) -> str:
     Returns:
         Safe filename string
     """
-    return re.sub(r'[<>:"/\\|?*]', '_', test_name)
+    return _UNSAFE_FILENAME_CHARS.sub('_', test_name)
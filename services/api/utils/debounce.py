@@ -0,0 +1,44 @@
+"""Debounced flushing of in-memory state to disk"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Callable
+
+
+class DebouncedFlush:
+    """
+    Runs a flush function once, DELAY seconds after the first of a burst of changes.
+
+    The flush itself runs in a worker thread. The timer is disarmed before the flush
+    starts, so changes made while it is writing arm a new timer instead of being
+    left unwritten; flushes are serialised so a later one never races an earlier one.
+    """
+
+    def __init__(self, delay_s: float, flush: Callable[[], None]):
+        """
+        Args:
+            delay_s: Delay between the first change and the flush
+            flush: Function writing the pending state (called in a worker thread)
+        """
+        self.delay_s = delay_s
+        self._flush = flush
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def schedule(self) -> None:
+        """Arm the timer unless it is already armed; must be called from the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.delay_s)
+        # Changes from here on schedule a new flush
+        self._task = None
+        await asyncio.to_thread(self.flush)
+
+    def flush(self) -> None:
+        """Write pending changes now (waits for a flush that is already running)"""
+        with self._lock:
+            self._flush()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from functools import wraps
 from typing import Any, Callable, TypeVar
@@ -15,6 +16,39 @@ logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _wrap(
+    func: F,
+    exc_type: type[Exception],
+    to_http: Callable[[Exception], HTTPException]
+) -> F:
+    """
+    Wrap func (sync or async) so that exc_type is re-raised as the HTTPException
+    built by to_http. HTTPExceptions raised by func pass through unchanged.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except exc_type as exc:
+                raise to_http(exc)
+        
+        return async_wrapper  # type: ignore[return-value]
+    
+    @wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except HTTPException:
+            raise
+        except exc_type as exc:
+            raise to_http(exc)
+    
+    return sync_wrapper  # type: ignore[return-value]
+
+
 def handle_key_error(
     status_code: int = 404,
     detail: str = ErrorMessages.TAB_NOT_FOUND
@@ -27,26 +61,11 @@ def handle_key_error(
         async def my_function():
             ...
     """
+    def to_http(exc: Exception) -> HTTPException:
+        return HTTPException(status_code=status_code, detail=detail)
+    
     def decorator(func: F) -> F:
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except KeyError:
-                raise HTTPException(status_code=status_code, detail=detail)
-        
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return func(*args, **kwargs)
-            except KeyError:
-                raise HTTPException(status_code=status_code, detail=detail)
-        
-        # Return async or sync wrapper based on function type
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore[return-value]
-        return sync_wrapper  # type: ignore[return-value]
+        return _wrap(func, KeyError, to_http)
     
     return decorator
 
@@ -63,27 +82,12 @@ def handle_runtime_error(
         async def my_function():
             ...
     """
+    def to_http(exc: Exception) -> HTTPException:
+        error_detail = detail if detail is not None else str(exc)
+        return HTTPException(status_code=status_code, detail=error_detail)
+    
     def decorator(func: F) -> F:
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except RuntimeError as exc:
-                error_detail = detail if detail is not None else str(exc)
-                raise HTTPException(status_code=status_code, detail=error_detail)
-        
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return func(*args, **kwargs)
-            except RuntimeError as exc:
-                error_detail = detail if detail is not None else str(exc)
-                raise HTTPException(status_code=status_code, detail=error_detail)
-        
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore[return-value]
-        return sync_wrapper  # type: ignore[return-value]
+        return _wrap(func, RuntimeError, to_http)
     
     return decorator
 
@@ -102,32 +106,12 @@ def handle_generic_error(
             ...
     """
     def decorator(func: F) -> F:
-        @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except HTTPException:
-                raise
-            except Exception as exc:
-                if log_error:
-                    logger.error(f"{detail_prefix} in {func.__name__}: {exc}", exc_info=True)
-                raise HTTPException(status_code=status_code, detail=f"{detail_prefix}: {exc}")
-        
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return func(*args, **kwargs)
-            except HTTPException:
-                raise
-            except Exception as exc:
-                if log_error:
-                    logger.error(f"{detail_prefix} in {func.__name__}: {exc}", exc_info=True)
-                raise HTTPException(status_code=status_code, detail=f"{detail_prefix}: {exc}")
+        def to_http(exc: Exception) -> HTTPException:
+            if log_error:
+                logger.error(f"{detail_prefix} in {func.__name__}: {exc}", exc_info=True)
+            return HTTPException(status_code=status_code, detail=f"{detail_prefix}: {exc}")
         
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore[return-value]
-        return sync_wrapper  # type: ignore[return-value]
+        return _wrap(func, Exception, to_http)
     
     return decorator
 
@@ -2,124 +2,218 @@
 
 from __future__ import annotations
 
-import tempfile
+import io
+import logging
+import os
+import time
 import zipfile
 from pathlib import Path
-from typing import Callable
+from typing import AsyncIterator, Callable, Iterable, Iterator
 
+import anyio
 from fastapi import HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from services.api.enums import ErrorMessages
 
+logger = logging.getLogger(__name__)
 
-def validate_file_path(
+
+# Read size per file while streaming ZIP archives
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Media type per (lower-case) file extension
+_MEDIA_TYPES = {
+    ".csv": "text/csv",
+    ".pcap": "application/vnd.tcpdump.pcap",
+    ".pcapng": "application/vnd.tcpdump.pcap",
+}
+
+
+def check_file_path(
     base_dir: Path,
     filename: str,
     base_name: str | None = None
-) -> Path:
+) -> tuple[Path | None, HTTPException | None]:
     """
     Validate and resolve a file path, protecting against path traversal attacks.
     
+    The error is returned instead of raised: callers probe several base
+    directories or many files, where a miss is expected and raising per
+    candidate would be wasted work.
+    
     Args:
         base_dir: Base directory that the file must be within
         filename: Name of the file to validate
         base_name: Optional base name that the file must start with
         
     Returns:
-        Resolved Path object
-        
-    Raises:
-        HTTPException: If validation fails
+        Tuple of (resolved path, None) or (None, HTTPException)
     """
     try:
         # Resolve the path to prevent path traversal
         candidate = (base_dir / filename).resolve()
         
-        # Ensure the file is within the base directory
-        if base_dir not in candidate.parents and candidate != base_dir:
-            raise HTTPException(
+        # Ensure the file is within the base directory (compares path parts, no parents walk)
+        if not candidate.is_relative_to(base_dir):
+            return None, HTTPException(
                 status_code=403,
                 detail="Zugriff verweigert: Datei außerhalb des erlaubten Verzeichnisses"
             )
         
         # Ensure the file starts with the expected base name
         if base_name and not candidate.name.startswith(base_name):
-            raise HTTPException(
+            return None, HTTPException(
                 status_code=403,
                 detail="Zugriff verweigert: Dateiname entspricht nicht dem erwarteten Muster"
             )
         
-        # Check if file exists
-        if not candidate.exists() or not candidate.is_file():
-            raise HTTPException(status_code=404, detail=ErrorMessages.FILE_NOT_FOUND)
+        # Check if file exists (is_file() is False for missing paths, one stat)
+        if not candidate.is_file():
+            return None, HTTPException(status_code=404, detail=ErrorMessages.FILE_NOT_FOUND)
         
-        return candidate
-    except HTTPException:
-        raise
+        return candidate, None
     except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Fehler bei Dateipfad-Validierung: {exc}")
+        return None, HTTPException(status_code=500, detail=f"Fehler bei Dateipfad-Validierung: {exc}")
 
 
-def create_zip_file(
-    zip_name: str,
-    add_files_callback: Callable[[zipfile.ZipFile], None]
-) -> Path:
+class _ZipStreamBuffer(io.RawIOBase):
+    """Unseekable write-only sink; zipfile writes data descriptors and the output is drained in chunks."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._chunks.append(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_info_from_fd(fd: int, arcname: str, compression: int) -> zipfile.ZipInfo:
+    """Like ZipInfo.from_file, but from an already opened file."""
+    st = os.fstat(fd)
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zinfo.compress_type = compression
+    return zinfo
+
+
+def iter_zip_stream(
+    entries: Iterable[tuple[Path, str]],
+    compression: int = zipfile.ZIP_STORED
+) -> Iterator[bytes]:
     """
-    Create a ZIP file in a temporary directory with the provided files.
+    Build a ZIP archive on the fly and yield it chunk by chunk.
     
     Args:
-        zip_name: Name of the ZIP file to create
-        add_files_callback: Callback function that receives a ZipFile object and adds files to it
+        entries: (file path, archive name) pairs to include
+        compression: zipfile compression method (default: ZIP_STORED)
         
-    Returns:
-        Path to the created ZIP file
+    Yields:
+        Consecutive parts of the ZIP archive
+    """
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=compression) as zf:
+        for file_path, arcname in entries:
+            # Open the file before writing its entry header: a ring file rotated away
+            # since the listing is skipped instead of breaking the archive mid-stream
+            try:
+                src = file_path.open("rb")
+            except FileNotFoundError:
+                logger.warning(f"Skipping {file_path} in ZIP stream: file no longer exists")
+                continue
+            with src, zf.open(_zip_info_from_fd(src.fileno(), arcname, compression), mode="w") as dest:
+                while chunk := src.read(ZIP_STREAM_CHUNK_SIZE):
+                    dest.write(chunk)
+                    data = buffer.drain()
+                    if data:
+                        yield data
+            data = buffer.drain()
+            if data:
+                yield data
+    # Central directory
+    data = buffer.drain()
+    if data:
+        yield data
+
+
+async def iterate_in_threads(
+    iterator: Iterator[bytes],
+    limiter: anyio.CapacityLimiter | None = None
+) -> AsyncIterator[bytes]:
+    """
+    Drive a blocking iterator from worker threads, one item per thread hop.
+    
+    Args:
+        iterator: Blocking iterator (e.g. iter_zip_stream)
+        limiter: Thread limiter to run under (default: anyio's default limiter)
         
-    Raises:
-        HTTPException: If ZIP creation fails
+    Yields:
+        The items of the iterator
     """
+    done = object()
     try:
-        tmp_dir = Path(tempfile.gettempdir())
-        zip_path = tmp_dir / zip_name
-        
-        with zipfile.ZipFile(zip_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            add_files_callback(zf)
-        
-        return zip_path
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"{ErrorMessages.ZIP_CREATION_FAILED}: {exc}"
-        )
+        while (item := await anyio.to_thread.run_sync(next, iterator, done, limiter=limiter)) is not done:
+            yield item
+    finally:
+        # Closes the files of an aborted download; never runs concurrently with
+        # next() because run_sync waits for its thread even when cancelled
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
 
 
 def create_zip_response(
     files: list[Path],
     zip_name: str,
-    arcname_callback: Callable[[Path], str] | None = None
-) -> FileResponse:
+    arcname_callback: Callable[[Path], str] | None = None,
+    compression: int = zipfile.ZIP_STORED,
+    limiter: anyio.CapacityLimiter | None = None
+) -> StreamingResponse:
     """
-    Create a ZIP file response with the given files.
+    Create a streaming ZIP response with the given files.
+    
+    The archive is written directly to the response instead of a temporary
+    file, so large captures are neither written twice nor left in /tmp.
     
     Args:
         files: List of file paths to include in the ZIP
         zip_name: Name of the ZIP file
         arcname_callback: Optional callback to generate archive names for files
+        compression: zipfile compression method (default: ZIP_STORED)
+        limiter: Thread limiter the archive is built under
         
     Returns:
-        FileResponse with the ZIP file
+        StreamingResponse with the ZIP file
+        
+    Raises:
+        HTTPException: If none of the files exists anymore
     """
-    def add_files(zf: zipfile.ZipFile) -> None:
-        for file_path in files:
-            arcname = arcname_callback(file_path) if arcname_callback else file_path.name
-            zf.write(file_path, arcname=arcname)
-    
-    zip_path = create_zip_file(zip_name, add_files)
-    
-    return FileResponse(
-        path=str(zip_path),
+    # Checked before the response starts, so a vanished selection is still a clean error
+    entries = [
+        (file_path, arcname_callback(file_path) if arcname_callback else file_path.name)
+        for file_path in files
+        if file_path.is_file()
+    ]
+    if not entries:
+        raise HTTPException(status_code=404, detail=ErrorMessages.FILE_NOT_FOUND)
+    return StreamingResponse(
+        iterate_in_threads(iter_zip_stream(entries, compression), limiter),
         media_type="application/zip",
-        filename=zip_name,
+        headers={"Content-Disposition": f'attachment; filename="{zip_name}"'},
     )
 
 
@@ -133,11 +227,4 @@ def get_file_media_type(file_path: Path) -> str:
     Returns:
         Media type string
     """
-    suffix = file_path.suffix.lower()
-    
-    if suffix == ".csv":
-        return "text/csv"
-    elif suffix in (".pcap", ".pcapng"):
-        return "application/vnd.tcpdump.pcap"
-    else:
-        return "application/octet-stream"
+    return _MEDIA_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
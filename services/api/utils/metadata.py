@@ -2,17 +2,122 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import sys
 from pathlib import Path
 from typing import Iterator
 
+import orjson
 from fastapi import HTTPException
 
 from services.api.enums import CaptureEvent, ErrorMessages
 
 logger = logging.getLogger(__name__)
 
+# Number of bytes at the start and before the cached offset compared to tell an
+# append from a rewrite of the file
+_APPEND_CHECK_BYTES = 256
+# Row fields with few distinct values that are interned in the cached rows
+_INTERNED_KEYS = ("event", "main_capture_id")
+
+
+class _RowCache:
+    """
+    Parsed rows of a metadata file plus the state needed to extend them on appends,
+    indexed once per reload so lookups do not scan all rows.
+    """
+
+    __slots__ = ("mtime_ns", "size", "offset", "head", "tail", "rows", "events", "by_id", "by_main", "grouped")
+
+    def __init__(self, mtime_ns: int, size: int, offset: int, head: bytes, tail: bytes, rows: list[dict]):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        # Bytes parsed up to the last complete line (0 = no incremental reload possible)
+        self.offset = offset
+        self.head = head
+        self.tail = tail
+        self.rows = rows
+        
+        # (row, capture_id) pairs in file order and row positions per capture_id and
+        # per main_capture_id (each row under its own main id, falling back to the capture_id)
+        self.events: list[tuple[dict, str]] = []
+        self.by_id: dict[str, list[int]] = {}
+        self.by_main: dict[str, list[int]] = {}
+        # Capture ids per main_capture_id, built on first use
+        self.grouped: dict[str, list[str]] | None = None
+        for index, row in enumerate(rows):
+            # Few distinct values repeated in every row: share one string object each
+            for key in _INTERNED_KEYS:
+                value = row.get(key)
+                if type(value) is str:
+                    row[key] = sys.intern(value)
+            capture_id = row.get("capture_id") or f"pid-{row.get('pid')}"
+            self.events.append((row, capture_id))
+            self.by_id.setdefault(capture_id, []).append(index)
+            self.by_main.setdefault(row.get("main_capture_id") or capture_id, []).append(index)
+    
+    def start_and_stop(self, capture_id: str) -> tuple[dict | None, dict | None]:
+        """Last start and stop event of a capture_id"""
+        start: dict | None = None
+        stop: dict | None = None
+        for index in self.by_id.get(capture_id, ()):
+            row = self.rows[index]
+            event = row.get("event")
+            if event == CaptureEvent.START.value:
+                start = row
+            elif event == CaptureEvent.STOP.value:
+                stop = row
+        return start, stop
+    
+    def start_event(self, capture_id: str) -> dict | None:
+        """Last start event of a capture_id, searched from the end"""
+        for index in reversed(self.by_id.get(capture_id, ())):
+            row = self.rows[index]
+            if row.get("event") == CaptureEvent.START.value:
+                return row
+        return None
+    
+    def group_by_main(self) -> dict[str, list[str]]:
+        """Capture ids of all start events per main_capture_id, computed once per reload"""
+        if self.grouped is None:
+            grouped: dict[str, list[str]] = {}
+            for row, capture_id in self.events:
+                if row.get("event") != CaptureEvent.START.value:
+                    continue
+                
+                main_id = row.get("main_capture_id") or capture_id
+                if main_id not in grouped:
+                    grouped[main_id] = []
+                grouped[main_id].append(capture_id)
+            self.grouped = grouped
+        return self.grouped
+
+
+# Parsed rows per metadata file, reused as long as mtime and size are unchanged.
+# The agent only appends events, so a grown file is parsed from the cached offset.
+# Module-level because the routes create a new MetadataService per request.
+_rows_cache: dict[Path, _RowCache] = {}
+_EMPTY_CACHE = _RowCache(0, 0, 0, b"", b"", [])
+
+
+def _parse_lines(data: bytes, rows: list[dict]) -> None:
+    """Parse JSON lines from data into rows, ignoring empty or malformed lines"""
+    # orjson skips surrounding whitespace itself, so lines are not copied by strip()
+    lines = [line for line in data.splitlines() if line and not line.isspace()]
+    try:
+        # Fast path: the whole block in one comprehension, no per-line error handling
+        rows.extend([orjson.loads(line) for line in lines])
+        return
+    except orjson.JSONDecodeError:
+        pass
+    
+    for line in lines:
+        try:
+            rows.append(orjson.loads(line))
+        except orjson.JSONDecodeError as exc:
+            logger.warning(f"Invalid JSON in metadata file: {line[:50].decode('utf-8', 'replace')}... Error: {exc}")
+
 
 class MetadataService:
     """
@@ -46,20 +151,46 @@ class MetadataService:
         Yields:
             Dictionary representing a metadata row
         """
-        if not self.exists():
-            return
+        yield from self._load().rows
+    
+    def _load(self) -> _RowCache:
+        """Return the parsed and indexed rows, re-reading the file only if it changed since the last read"""
+        try:
+            st = self.meta_file.stat()
+        except OSError:
+            _rows_cache.pop(self.meta_file, None)
+            return _EMPTY_CACHE
         
-        with self.meta_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    row = json.loads(line)
-                    yield row
-                except json.JSONDecodeError as exc:
-                    logger.warning(f"Invalid JSON in metadata file: {line[:50]}... Error: {exc}")
-                    continue
+        cached = _rows_cache.get(self.meta_file)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+            return cached
+        
+        base = 0
+        rows: list[dict] = []
+        with self.meta_file.open("rb") as f:
+            if cached is not None and cached.offset and st.st_size > cached.offset:
+                # Only parse the appended lines if start and old end of the file are unchanged
+                head_ok = f.read(len(cached.head)) == cached.head
+                f.seek(cached.offset - len(cached.tail))
+                data = f.read()
+                if head_ok and data.startswith(cached.tail):
+                    base = cached.offset
+                    data = data[len(cached.tail):]
+                    rows = list(cached.rows)
+                else:
+                    f.seek(0)
+                    data = f.read()
+            else:
+                data = f.read()
+        
+        _parse_lines(data, rows)
+        # A trailing line without newline may still be written; reload fully next time
+        offset = base + len(data) if data.endswith(b"\n") else 0
+        head = cached.head if base else data[:_APPEND_CHECK_BYTES]
+        tail = ((cached.tail if base else b"") + data)[-_APPEND_CHECK_BYTES:]
+        cached = _RowCache(st.st_mtime_ns, st.st_size, offset, head, tail, rows)
+        _rows_cache[self.meta_file] = cached
+        return cached
     
     def iter_events(self) -> Iterator[tuple[dict, str]]:
         """
@@ -68,9 +199,7 @@ class MetadataService:
         Yields:
             Tuple of (row_dict, capture_id)
         """
-        for row in self.iter_rows():
-            capture_id = row.get("capture_id") or f"pid-{row.get('pid')}"
-            yield row, capture_id
+        yield from self._load().events
     
     def get_start_and_stop(self, capture_id: str) -> tuple[dict | None, dict | None]:
         """
@@ -82,20 +211,7 @@ class MetadataService:
         Returns:
             Tuple of (start_event, stop_event), either can be None
         """
-        start: dict | None = None
-        stop: dict | None = None
-        
-        for row, row_capture_id in self.iter_events():
-            if row_capture_id != capture_id:
-                continue
-            
-            event = row.get("event")
-            if event == CaptureEvent.START.value:
-                start = row
-            elif event == CaptureEvent.STOP.value:
-                stop = row
-        
-        return start, stop
+        return self._load().start_and_stop(capture_id)
     
     def get_start_event(self, capture_id: str) -> dict | None:
         """
@@ -107,8 +223,7 @@ class MetadataService:
         Returns:
             Start event dictionary or None
         """
-        start, _ = self.get_start_and_stop(capture_id)
-        return start
+        return self._load().start_event(capture_id)
     
     def find_related_captures(self, capture_id: str) -> tuple[dict[str, dict], dict[str, dict]]:
         """
@@ -122,26 +237,29 @@ class MetadataService:
         """
         self.ensure_exists()
         
+        cache = self._load()
+        
         # First get the main capture's start event
-        start_event = self.get_start_event(capture_id)
+        start_event = cache.start_event(capture_id)
         if not start_event:
             return {}, {}
         
         # Get the main_capture_id
         main_capture_id = start_event.get("main_capture_id") or capture_id
         
-        # Find all related captures
+        # Find all related captures (rows of the main id or of the capture itself, in file order)
         related_starts: dict[str, dict] = {}
         related_stops: dict[str, dict] = {}
         
-        for row, cid in self.iter_events():
-            row_main_id = row.get("main_capture_id") or cid
-            if row_main_id == main_capture_id or cid == capture_id:
-                event = row.get("event")
-                if event == CaptureEvent.START.value:
-                    related_starts[cid] = row
-                elif event == CaptureEvent.STOP.value:
-                    related_stops[cid] = row
+        positions = set(cache.by_main.get(main_capture_id, ()))
+        positions.update(cache.by_id.get(capture_id, ()))
+        for index in sorted(positions):
+            row, cid = cache.events[index]
+            event = row.get("event")
+            if event == CaptureEvent.START.value:
+                related_starts[cid] = row
+            elif event == CaptureEvent.STOP.value:
+                related_stops[cid] = row
         
         return related_starts, related_stops
     
@@ -150,9 +268,9 @@ class MetadataService:
         Read all metadata rows into memory.
         
         Returns:
-            List of all metadata rows
+            List of all metadata rows (copies, safe to modify)
         """
-        return list(self.iter_rows())
+        return [dict(row) for row in self._load().rows]
     
     def write_all_rows(self, rows: list[dict]) -> None:
         """
@@ -161,11 +279,16 @@ class MetadataService:
         Args:
             rows: List of metadata rows to write
         """
+        _rows_cache.pop(self.meta_file, None)
+        # One buffer, one write; the temp file replaces the original atomically so
+        # readers never see a half-written file
+        data = b"".join([orjson.dumps(row) + b"\n" for row in rows])
+        tmp_file = self.meta_file.with_name(self.meta_file.name + ".tmp")
         try:
-            with self.meta_file.open("w", encoding="utf-8") as f:
-                for row in rows:
-                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.meta_file)
         except Exception as exc:
+            tmp_file.unlink(missing_ok=True)
             logger.error(f"Failed to write metadata file: {exc}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Fehler beim Speichern der Metadaten: {exc}")
     
@@ -176,15 +299,5 @@ class MetadataService:
         Returns:
             Dictionary mapping main_capture_id to list of capture_ids
         """
-        grouped: dict[str, list[str]] = {}
-        
-        for row, capture_id in self.iter_events():
-            if row.get("event") != CaptureEvent.START.value:
-                continue
-            
-            main_id = row.get("main_capture_id") or capture_id
-            if main_id not in grouped:
-                grouped[main_id] = []
-            grouped[main_id].append(capture_id)
-        
-        return grouped
+        # Copies, the cached grouping is shared between requests
+        return {main_id: list(capture_ids) for main_id, capture_ids in self._load().group_by_main().items()}
@@ -3,6 +3,7 @@ from typing import Optional, Dict
 
 
 ansi_escape_re = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+hex_digits_re = re.compile(r"[0-9a-fA-F]+")
 
 
 def strip_ansi_sequences(text: str) -> str:
@@ -17,12 +18,13 @@ def parse_enabled_disabled_line(line: str) -> Optional[Dict[str, object]]:
 	Parst eine Zeile im Format "<Name>: enabled|disabled".
 	Gibt ein Dict mit name und status (bool) zurück, sonst None.
 	"""
-	m = re.match(r"^(?P<name>[^:]+):\s*(?P<status>enabled|disabled)\s*$", line.strip(), re.IGNORECASE)
-	if not m:
+	name, sep, rest = line.strip().partition(":")
+	if not sep or not name:
 		return None
-	name = m.group("name").strip()
-	status_str = m.group("status").lower()
-	return {"name": name, "status": True if status_str == "enabled" else False}
+	status_str = rest.strip().lower()
+	if status_str not in ("enabled", "disabled"):
+		return None
+	return {"name": name.strip(), "status": status_str == "enabled"}
 
 
 def parse_int_maybe_hex(value: str) -> Optional[int]:
@@ -32,17 +34,17 @@ def parse_int_maybe_hex(value: str) -> Optional[int]:
 	"""
 	if value is None:
 		return None
-	text = str(value).strip()
+	text = value.strip() if isinstance(value, str) else str(value).strip()
 	if not text:
 		return None
 	try:
-		if text.lower().startswith("0x"):
+		if text[:2] in ("0x", "0X"):
 			return int(text, 16)
 		# Manche Ausgaben sind reine Hex-Zeichen ohne 0x
-		if re.fullmatch(r"[0-9a-fA-F]+", text):
+		if hex_digits_re.fullmatch(text):
 			return int(text, 16)
 		return int(text)
-	except Exception:
+	except ValueError:
 		return None
 
 
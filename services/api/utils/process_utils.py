@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import os
+from typing import Iterable
+
+# On Linux a process exists exactly as long as its /proc entry does
+_HAS_PROC = os.path.isdir("/proc/self")
 
 
 def is_process_running(pid: int | None) -> bool:
@@ -18,6 +22,10 @@ def is_process_running(pid: int | None) -> bool:
     if pid is None:
         return False
     
+    if _HAS_PROC:
+        # One stat() without exception handling in the common "still running" case
+        return isinstance(pid, int) and pid > 0 and os.path.exists(f"/proc/{pid}")
+    
     try:
         os.kill(pid, 0)  # Signal 0 doesn't kill, just checks if process exists
         return True
@@ -27,3 +35,25 @@ def is_process_running(pid: int | None) -> bool:
         return True  # Process exists but we don't have permission to signal it
     except Exception:
         return False
+
+
+def are_processes_running(pids: Iterable[int | None]) -> dict[int | None, bool]:
+    """
+    Check several PIDs at once; on Linux this is a single /proc listing
+    instead of one check per PID.
+    
+    Args:
+        pids: Process IDs to check
+        
+    Returns:
+        Mapping of each given PID to whether the process is running
+    """
+    pids = set(pids)
+    if _HAS_PROC and pids:
+        try:
+            alive = {int(name) for name in os.listdir("/proc") if name.isdigit()}
+        except OSError:
+            alive = None
+        if alive is not None:
+            return {pid: isinstance(pid, int) and pid in alive for pid in pids}
+    return {pid: is_process_running(pid) for pid in pids}
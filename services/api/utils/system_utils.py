@@ -2,22 +2,94 @@
 
 from __future__ import annotations
 
+import time
+from pathlib import Path
+
 import psutil
 
+# The temperature only changes slowly while the dashboard polls it from several
+# endpoints; a reading is reused for a short time instead of re-reading all sensors
+_CPU_TEMP_TTL_S = 1.0
+_cpu_temp_cache: dict[str, float | None] = {"ts": None, "value": None}
+
+# hwmon sensors used for the CPU temperature, in order of preference (same names
+# as the psutil.sensors_temperatures() keys)
+_HWMON_DIR = Path("/sys/class/hwmon")
+_CPU_SENSOR_NAMES = ("cpu_thermal", "coretemp")
+# Input file of the CPU sensor, or else its psutil key, found on the first call
+_cpu_temp_input: Path | None = None
+_cpu_sensor_key: str | None = None
+_cpu_temp_probed = False
+
 
 def get_cpu_temperature() -> float | None:
     """
-    Get the current CPU temperature.
+    Get the current CPU temperature (cached for _CPU_TEMP_TTL_S).
     
     Returns:
         CPU temperature in Celsius, or None if not available
     """
+    now = time.monotonic()
+    ts = _cpu_temp_cache["ts"]
+    if ts is not None and now - ts < _CPU_TEMP_TTL_S:
+        return _cpu_temp_cache["value"]
+    
+    value = _read_cpu_temperature()
+    _cpu_temp_cache.update(ts=now, value=value)
+    return value
+
+
+def _find_cpu_temp_input() -> Path | None:
+    """
+    Find the first temperature input of the preferred CPU hwmon sensor, the same
+    entry psutil reports first for that sensor.
+    """
+    found: dict[str, Path] = {}
+    try:
+        hwmons = sorted(_HWMON_DIR.glob("hwmon*"))
+    except OSError:
+        return None
+    for hwmon in hwmons:
+        try:
+            name = (hwmon / "name").read_text().strip()
+        except OSError:
+            continue
+        if name in _CPU_SENSOR_NAMES and name not in found:
+            inputs = sorted(hwmon.glob("temp*_input"))
+            if inputs:
+                found[name] = inputs[0]
+    for name in _CPU_SENSOR_NAMES:
+        if name in found:
+            return found[name]
+    return None
+
+
+def _find_cpu_sensor_key() -> str | None:
     try:
         temp = psutil.sensors_temperatures()
-        if 'cpu_thermal' in temp:
-            return temp['cpu_thermal'][0].current
-        elif 'coretemp' in temp:
-            return temp['coretemp'][0].current
+    except AttributeError:
         return None
+    return next((name for name in _CPU_SENSOR_NAMES if name in temp), None)
+
+
+def _read_cpu_temperature() -> float | None:
+    global _cpu_temp_input, _cpu_sensor_key, _cpu_temp_probed
+    if not _cpu_temp_probed:
+        _cpu_temp_input = _find_cpu_temp_input()
+        _cpu_sensor_key = _find_cpu_sensor_key() if _cpu_temp_input is None else None
+        _cpu_temp_probed = True
+    
+    # Single sysfs read (milli-degrees Celsius) instead of enumerating every sensor
+    if _cpu_temp_input is not None:
+        try:
+            return float(_cpu_temp_input.read_bytes()) / 1000.0
+        except (OSError, ValueError):
+            return None
+    
+    # psutil reported no CPU sensor on this host
+    if _cpu_sensor_key is None:
+        return None
+    try:
+        return psutil.sensors_temperatures()[_cpu_sensor_key][0].current
     except (AttributeError, KeyError, IndexError):
         return None